@@ -1,11 +1,22 @@
 """RSVP playback engine."""
+import bisect
+import time
+from array import array
+from itertools import accumulate
 from dataclasses import dataclass, field
 from typing import Optional
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
 
 from rsvp.core.text_processor import Word, process_text
 from rsvp.core.settings import get_settings_manager
 
+# If playback falls further behind schedule than this (in seconds), e.g.
+# after the event loop stalls, restart the schedule instead of rushing
+# through words to catch up.
+MAX_SCHEDULE_LAG = 0.25
+
+_SENTENCE_ENDS = frozenset('.!?')
+
 
 @dataclass
 class RSVPState:
@@ -15,6 +26,26 @@ class RSVPState:
     wpm: int = 300
     is_playing: bool = False
 
+    # Per-word columns derived from words, rebuilt by set_words(). Stored as
+    # C arrays so a long document costs a few bytes per word per column.
+    pauses: array = field(default_factory=lambda: array('f'), init=False, repr=False)
+    sentence_ends: array = field(default_factory=lambda: array('l'), init=False, repr=False)
+    # remaining_pauses[i] is the sum of pauses[i:], with a trailing 0.0
+    remaining_pauses: array = field(default_factory=lambda: array('d'), init=False, repr=False)
+
+    def __post_init__(self):
+        self.set_words(self.words)
+
+    def set_words(self, words: list[Word]):
+        """Replace the word list and rebuild the derived columns."""
+        self.words = words
+        self.pauses = array('f', [w.pause_after for w in words])
+        self.remaining_pauses = array('d', accumulate(reversed(self.pauses), initial=0.0))
+        self.remaining_pauses.reverse()
+        self.sentence_ends = array('l', [
+            i for i, w in enumerate(words) if w.text and w.text[-1] in _SENTENCE_ENDS
+        ])
+
     @property
     def current_word(self) -> Optional[Word]:
         """Get the current word."""
@@ -31,6 +62,11 @@ class RSVPState:
             return 100.0
         return (self.current_index / (len(self.words) - 1)) * 100
 
+    @property
+    def progress_permille(self) -> int:
+        """Get progress in thousandths (0-1000)."""
+        return int(self.progress * 10)
+
     @property
     def words_remaining(self) -> int:
         """Get number of words remaining."""
@@ -42,7 +78,8 @@ class RSVPState:
         if self.wpm <= 0:
             return 0.0
         base_interval = 60.0 / self.wpm
-        return sum(base_interval * w.pause_after for w in self.words[self.current_index:])
+        index = max(0, min(self.current_index, len(self.words)))
+        return base_interval * self.remaining_pauses[index]
 
 
 class RSVPEngine(QObject):
@@ -51,14 +88,23 @@ class RSVPEngine(QObject):
     # Signals
     word_changed = pyqtSignal(object)  # Emits Word or None
     state_changed = pyqtSignal()  # Emits when play/pause/stop changes
-    progress_changed = pyqtSignal(float)  # Emits progress percentage
+    progress_changed = pyqtSignal(int)  # Emits progress in permille (0-1000)
+    seconds_remaining_changed = pyqtSignal(int)  # Emits whole seconds left
     finished = pyqtSignal()  # Emits when reaching end of text
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._state = RSVPState()
         self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
         self._timer.timeout.connect(self._advance)
+        # perf_counter() times at which the current word was due on screen
+        # and at which the next word is due
+        self._word_due = 0.0
+        self._deadline = 0.0
+        self._progress_permille: Optional[int] = None
+        self._seconds_remaining: Optional[int] = None
 
     @property
     def state(self) -> RSVPState:
@@ -73,9 +119,13 @@ class RSVPEngine(QObject):
     @wpm.setter
     def wpm(self, value: int):
         """Set words per minute."""
-        self._state.wpm = max(50, min(2000, value))
+        wpm = max(50, min(2000, value))
+        if wpm == self._state.wpm:
+            return
+        self._state.wpm = wpm
         if self._state.is_playing:
             self._update_timer_interval()
+        self._emit_seconds_remaining()
 
     @property
     def is_playing(self) -> bool:
@@ -94,11 +144,16 @@ class RSVPEngine(QObject):
 
     def load_text(self, text: str):
         """Load text for RSVP display."""
+        self.load_words(process_text(text))
+
+    def load_words(self, words: list[Word]):
+        """Load already-processed words for RSVP display."""
         self.stop()
-        self._state.words = process_text(text)
+        self._state.set_words(words)
         self._state.current_index = 0
         self.state_changed.emit()
-        self.progress_changed.emit(0.0)
+        self._emit_progress(force=True)
+        self._emit_seconds_remaining(force=True)
         if self._state.words:
             self.word_changed.emit(self._state.current_word)
         else:
@@ -114,6 +169,7 @@ class RSVPEngine(QObject):
             self._state.current_index = 0
 
         self._state.is_playing = True
+        self._word_due = time.perf_counter()
         self._update_timer_interval()
         self._timer.start()
         self.state_changed.emit()
@@ -137,7 +193,8 @@ class RSVPEngine(QObject):
         self._timer.stop()
         self._state.current_index = 0
         self.state_changed.emit()
-        self.progress_changed.emit(0.0)
+        self._emit_progress(force=True)
+        self._emit_seconds_remaining()
         if self._state.words:
             self.word_changed.emit(self._state.current_word)
 
@@ -148,7 +205,8 @@ class RSVPEngine(QObject):
 
         self._state.current_index = max(0, min(index, len(self._state.words) - 1))
         self.word_changed.emit(self._state.current_word)
-        self.progress_changed.emit(self._state.progress)
+        self._emit_progress()
+        self._emit_seconds_remaining()
 
     def seek_percent(self, percent: float):
         """Seek to a percentage of the text."""
@@ -174,22 +232,23 @@ class RSVPEngine(QObject):
         if not self._state.words:
             return
 
+        ends = self._state.sentence_ends
+
         # Start from one word before current
         idx = max(0, self._state.current_index - 1)
+        # Position of the last sentence end at or before idx
+        j = bisect.bisect_right(ends, idx) - 1
 
         # Skip past any contiguous sentence-ending words at the start position.
         # This prevents getting stuck when already at a sentence boundary.
-        while idx > 0 and self._state.words[idx].text and self._state.words[idx].text[-1] in '.!?':
+        while idx > 0 and j >= 0 and ends[j] == idx:
             idx -= 1
+            j -= 1
 
-        # Find the previous sentence-ending punctuation
-        while idx > 0:
-            word = self._state.words[idx]
-            if word.text and word.text[-1] in '.!?':
-                # Found end of previous sentence, go to start of next
-                self.seek(idx + 1)
-                return
-            idx -= 1
+        # Jump to the start of the sentence after the previous sentence end
+        if j >= 0 and ends[j] > 0:
+            self.seek(ends[j] + 1)
+            return
 
         # No previous sentence found, go to beginning
         self.seek(0)
@@ -199,25 +258,43 @@ class RSVPEngine(QObject):
         if not self._state.words:
             return
 
-        idx = self._state.current_index
+        ends = self._state.sentence_ends
+        last = len(self._state.words) - 1
 
-        # Find the next sentence-ending punctuation
-        while idx < len(self._state.words) - 1:
-            word = self._state.words[idx]
-            if word.text and word.text[-1] in '.!?':
-                # Found end of sentence, go to start of next
-                self.seek(idx + 1)
-                return
-            idx += 1
+        # Find the next sentence end at or after the current word
+        j = bisect.bisect_left(ends, self._state.current_index)
+        if j < len(ends) and ends[j] < last:
+            self.seek(ends[j] + 1)
+            return
 
         # No next sentence found, go to end
-        self.seek(len(self._state.words) - 1)
+        self.seek(last)
+
+    def _emit_progress(self, force: bool = False):
+        """Emit progress_changed if the permille value changed."""
+        permille = self._state.progress_permille
+        if force or permille != self._progress_permille:
+            self._progress_permille = permille
+            self.progress_changed.emit(permille)
+
+    def _emit_seconds_remaining(self, force: bool = False):
+        """Emit seconds_remaining_changed if the whole-second estimate changed."""
+        seconds = int(self._state.time_remaining_seconds)
+        if force or seconds != self._seconds_remaining:
+            self._seconds_remaining = seconds
+            self.seconds_remaining_changed.emit(seconds)
 
     def _update_timer_interval(self):
-        """Update timer interval based on WPM and current word."""
-        base_interval = 60000 / self._state.wpm
+        """Update timer interval based on WPM and current word.
+
+        While playing, the delay is measured from when the current word was
+        due rather than from now, so millisecond rounding and timer latency
+        do not accumulate from word to word.
+        """
+        state = self._state
+        base_interval = 60000 / state.wpm
 
-        current = self._state.current_word
+        current = state.current_word
         if current:
             interval = base_interval * current.pause_after
             if current.paragraph_break_after and get_settings_manager().settings.pause_at_paragraphs:
@@ -225,20 +302,33 @@ class RSVPEngine(QObject):
         else:
             interval = base_interval
 
-        self._timer.setInterval(int(interval))
+        if state.is_playing:
+            self._deadline = self._word_due + interval / 1000
+            interval = (self._deadline - time.perf_counter()) * 1000
+
+        self._timer.setInterval(max(0, round(interval)))
 
     def _advance(self):
         """Advance to the next word."""
-        self._state.current_index += 1
+        state = self._state
+        if state.is_playing:
+            now = time.perf_counter()
+            self._word_due = self._deadline if now - self._deadline < MAX_SCHEDULE_LAG else now
+
+        state.current_index += 1
 
-        if self._state.current_index >= len(self._state.words):
+        if state.current_index >= len(state.words):
             # Reached the end
-            self._state.current_index = len(self._state.words) - 1
+            state.current_index = len(state.words) - 1
             self.pause()
-            self.progress_changed.emit(self._state.progress)
+            self._emit_progress(force=True)
+            self._emit_seconds_remaining()
             self.finished.emit()
             return
 
-        self.word_changed.emit(self._state.current_word)
-        self.progress_changed.emit(self._state.progress)
+        self.word_changed.emit(state.current_word)
+        self._emit_progress()
+        self._emit_seconds_remaining()
         self._update_timer_interval()
+        if state.is_playing:
+            self._timer.start()
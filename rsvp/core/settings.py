@@ -1,9 +1,21 @@
 """Settings management for RSVP application."""
 import json
-from dataclasses import dataclass, asdict, field
+import os
+from dataclasses import dataclass, field, fields
+from itertools import islice
 from pathlib import Path
 from typing import Optional
 
+from PyQt6.QtCore import QCoreApplication, QTimer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Delay before coalesced setting changes are written to disk
+SAVE_DELAY_MS = 500
+
 
 @dataclass
 class RSVPSettings:
@@ -37,6 +49,13 @@ class RSVPSettings:
     # Saved reading positions: maps source path/URL to word index
     saved_positions: dict[str, int] = field(default_factory=dict)
 
+    # Directory the open-file dialogs start in
+    last_open_dir: str = ""
+
+    def to_dict(self) -> dict:
+        """Map field names to values without copying them, for serialization."""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 
 class SettingsManager:
     """Manager for loading and saving settings."""
@@ -44,6 +63,8 @@ class SettingsManager:
     def __init__(self):
         self._settings = RSVPSettings()
         self._settings_were_reset = False
+        self._dirty = False
+        self._save_timer: Optional[QTimer] = None
         self._config_path = self._get_config_path()
         self.load()
 
@@ -104,26 +125,66 @@ class SettingsManager:
         return result
 
     def save(self):
-        """Save settings to file."""
+        """Save settings to file.
+
+        Writes to a temporary file first and swaps it into place so a crash
+        mid-write never leaves a truncated settings file behind.
+        """
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        self._dirty = False
+
+        data = self._settings.to_dict()
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode('utf-8')
+
+        tmp_path = self._config_path.with_suffix('.json.tmp')
         try:
-            with open(self._config_path, 'w', encoding='utf-8') as f:
-                json.dump(asdict(self._settings), f, indent=2)
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._config_path)
         except IOError:
             pass
 
+    def flush(self):
+        """Write any pending changes to disk immediately."""
+        if self._dirty:
+            self.save()
+
+    def request_save(self):
+        """Mark settings dirty and coalesce the write with other recent changes.
+
+        The write happens SAVE_DELAY_MS after the last request, or on flush().
+        """
+        self._dirty = True
+        if QCoreApplication.instance() is None:
+            # No event loop to drive the timer, so write straight away
+            self.save()
+            return
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(SAVE_DELAY_MS)
+            self._save_timer.timeout.connect(self.flush)
+        self._save_timer.start()
+
     def add_recent_file(self, filepath: str):
         """Add a file to the recent files list."""
-        # Remove if already exists
-        if filepath in self._settings.recent_files:
-            self._settings.recent_files.remove(filepath)
-
-        # Add to front
-        self._settings.recent_files.insert(0, filepath)
+        limit = self._settings.max_recent_files
+        # Move to front in a single pass, dropping any existing entry and
+        # stopping as soon as the list is full
+        others = (f for f in self._settings.recent_files if f != filepath)
+        self._settings.recent_files = [filepath, *islice(others, max(0, limit - 1))][:limit]
 
-        # Trim to max
-        self._settings.recent_files = self._settings.recent_files[:self._settings.max_recent_files]
+        self.request_save()
 
-        self.save()
+    def set_last_open_dir(self, directory: str):
+        """Remember the directory a file was last opened from."""
+        if directory != self._settings.last_open_dir:
+            self._settings.last_open_dir = directory
+            self.request_save()
 
     def add_bookmark(self, filepath: str, word_index: int):
         """Add a bookmark for a file."""
@@ -133,14 +194,14 @@ class SettingsManager:
         if word_index not in self._settings.bookmarks[filepath]:
             self._settings.bookmarks[filepath].append(word_index)
             self._settings.bookmarks[filepath].sort()
-            self.save()
+            self.request_save()
 
     def remove_bookmark(self, filepath: str, word_index: int):
         """Remove a bookmark."""
         if filepath in self._settings.bookmarks:
             if word_index in self._settings.bookmarks[filepath]:
                 self._settings.bookmarks[filepath].remove(word_index)
-                self.save()
+                self.request_save()
 
     def get_bookmarks(self, filepath: str) -> list[int]:
         """Get bookmarks for a file."""
@@ -149,7 +210,7 @@ class SettingsManager:
     def save_position(self, source: str, index: int):
         """Save reading position for a source."""
         self._settings.saved_positions[source] = index
-        self.save()
+        self.request_save()
 
     def get_position(self, source: str) -> int | None:
         """Get saved reading position for a source."""
@@ -158,7 +219,7 @@ class SettingsManager:
     def clear_position(self, source: str):
         """Clear saved reading position for a source."""
         self._settings.saved_positions.pop(source, None)
-        self.save()
+        self.request_save()
 
 
 # Global settings instance
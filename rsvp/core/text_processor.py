@@ -1,11 +1,22 @@
 """Text processing utilities for RSVP."""
+import codecs
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
+if TYPE_CHECKING:
+    import requests
+
+_PARAGRAPH_RE = re.compile(r'\n\s*\n')
+
+_SENTENCE_ENDS = frozenset('.!?')
+_CLAUSE_SEPS = frozenset(',;:')
+_CLOSERS = frozenset('"\')')
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Word:
     """Represents a word with its optimal recognition point (ORP)."""
     text: str
@@ -13,20 +24,24 @@ class Word:
     pause_after: float  # Multiplier for pause duration after this word
     paragraph_break_after: bool = False
 
-    @property
-    def before_orp(self) -> str:
-        """Text before the ORP character."""
-        return self.text[:self.orp_index]
+    # Slices of text around the ORP character, split once on construction
+    before_orp: str = field(init=False, repr=False, compare=False)
+    orp_char: str = field(init=False, repr=False, compare=False)
+    after_orp: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        text, i = self.text, self.orp_index
+        if i < len(text):
+            before, orp, after = text[:i], text[i], text[i + 1:]
+        else:
+            before, orp, after = text[:i], "", ""
+        object.__setattr__(self, 'before_orp', before)
+        object.__setattr__(self, 'orp_char', orp)
+        object.__setattr__(self, 'after_orp', after)
 
-    @property
-    def orp_char(self) -> str:
-        """The ORP character."""
-        return self.text[self.orp_index] if self.orp_index < len(self.text) else ""
 
-    @property
-    def after_orp(self) -> str:
-        """Text after the ORP character."""
-        return self.text[self.orp_index + 1:] if self.orp_index < len(self.text) else ""
+# ORP index by word length; longer words use the last entry, 4
+_ORP_BY_LENGTH = (0, 0, 0, 0, 1, 1, 2, 2, 2, 2, 3, 3, 3, 3, 4)
 
 
 def calculate_orp(word: str) -> int:
@@ -37,19 +52,16 @@ def calculate_orp(word: str) -> int:
     Research suggests this is typically around 1/3 into the word,
     slightly left of center.
     """
-    length = len(word)
-    if length <= 1:
-        return 0
-    elif length <= 3:
-        return 0
-    elif length <= 5:
-        return 1
-    elif length <= 9:
-        return 2
-    elif length <= 13:
-        return 3
-    else:
-        return 4
+    n = len(word)
+    return _ORP_BY_LENGTH[n] if n < 15 else 4
+
+
+# Pause multiplier by a word's final character, apart from closing quotes and
+# brackets, which depend on the character before them
+_PAUSE_BY_LAST_CHAR = {
+    **dict.fromkeys(_SENTENCE_ENDS, 2.5),  # End of sentence
+    **dict.fromkeys(_CLAUSE_SEPS, 1.5),  # Clause separators
+}
 
 
 def calculate_pause_multiplier(word: str) -> float:
@@ -63,47 +75,48 @@ def calculate_pause_multiplier(word: str) -> float:
 
     last_char = word[-1]
 
-    # End of sentence
-    if last_char in '.!?':
-        return 2.5
-    # Clause separators
-    elif last_char in ',;:':
-        return 1.5
     # Other punctuation
-    elif last_char in '"\')':
+    if last_char in _CLOSERS:
         # Check if there's sentence-ending punctuation before
-        if len(word) > 1 and word[-2] in '.!?':
+        if len(word) > 1 and word[-2] in _SENTENCE_ENDS:
             return 2.5
         return 1.2
 
-    return 1.0
+    return _PAUSE_BY_LAST_CHAR.get(last_char, 1.0)
 
 
-def strip_markdown(text: str) -> str:
-    """Strip Markdown syntax, keeping readable text."""
+# (pattern, replacement) pairs applied in order by strip_markdown
+_MARKDOWN_RULES = tuple((re.compile(pattern, flags), repl) for pattern, repl, flags in (
     # Code blocks (fenced)
-    text = re.sub(r'```[\s\S]*?```', '', text)
+    (r'```[\s\S]*?```', '', 0),
     # Inline code
-    text = re.sub(r'`([^`]+)`', r'\1', text)
+    (r'`([^`]+)`', r'\1', 0),
     # Images (keep alt text)
-    text = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'\1', text)
+    (r'!\[([^\]]*)\]\([^)]+\)', r'\1', 0),
     # Links (keep link text)
-    text = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', text)
+    (r'\[([^\]]+)\]\([^)]+\)', r'\1', 0),
     # Headers
-    text = re.sub(r'^#{1,6}\s+', '', text, flags=re.MULTILINE)
+    (r'^#{1,6}\s+', '', re.MULTILINE),
     # Bold + italic combined
-    text = re.sub(r'\*{3}([^*]+)\*{3}', r'\1', text)
-    text = re.sub(r'_{3}([^_]+)_{3}', r'\1', text)
+    (r'\*{3}([^*]+)\*{3}', r'\1', 0),
+    (r'_{3}([^_]+)_{3}', r'\1', 0),
     # Bold
-    text = re.sub(r'\*{2}([^*]+)\*{2}', r'\1', text)
-    text = re.sub(r'_{2}([^_]+)_{2}', r'\1', text)
+    (r'\*{2}([^*]+)\*{2}', r'\1', 0),
+    (r'_{2}([^_]+)_{2}', r'\1', 0),
     # Italic
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)
-    text = re.sub(r'_([^_\s]+)_', r'\1', text)
+    (r'\*([^*]+)\*', r'\1', 0),
+    (r'_([^_\s]+)_', r'\1', 0),
     # Horizontal rules
-    text = re.sub(r'^[\-\*_]{3,}\s*$', '', text, flags=re.MULTILINE)
+    (r'^[\-\*_]{3,}\s*$', '', re.MULTILINE),
     # HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
+    (r'<[^>]+>', '', 0),
+))
+
+
+def strip_markdown(text: str) -> str:
+    """Strip Markdown syntax, keeping readable text."""
+    for pattern, repl in _MARKDOWN_RULES:
+        text = pattern.sub(repl, text)
     return text
 
 
@@ -115,55 +128,112 @@ def process_text(text: str) -> list[Word]:
     Detects paragraph boundaries (double newlines) and marks the last word
     of each paragraph (except the final one) with paragraph_break_after=True.
     """
-    if not text or not text.strip():
+    if not text or text.isspace():
         return []
 
-    paragraphs = re.split(r'\n\s*\n', text)
-
-    all_words: list[Word] = []
+    tokens: list[str] = []
     paragraph_end_indices: list[int] = []
 
-    for para in paragraphs:
-        normalized = re.sub(r'\s+', ' ', para.strip())
-        if not normalized:
-            continue
-        para_start = len(all_words)
-        for raw_word in normalized.split():
-            if raw_word:
-                orp = calculate_orp(raw_word)
-                pause = calculate_pause_multiplier(raw_word)
-                all_words.append(Word(text=raw_word, orp_index=orp, pause_after=pause))
-        if len(all_words) > para_start:
-            paragraph_end_indices.append(len(all_words) - 1)
-
+    for para in _PARAGRAPH_RE.split(text):
+        para_tokens = para.split()
+        if para_tokens:
+            tokens.extend(para_tokens)
+            paragraph_end_indices.append(len(tokens) - 1)
+
+    # Identical tokens share a single interned Word, so a document costs one
+    # Word per distinct token rather than one per occurrence. ORP and pause
+    # are computed once per distinct token in a single batch.
+    vocabulary = list(dict.fromkeys(tokens))
+    shared = dict(zip(vocabulary, map(
+        Word,
+        map(sys.intern, vocabulary),
+        map(calculate_orp, vocabulary),
+        map(calculate_pause_multiplier, vocabulary),
+    )))
+    all_words = list(map(shared.__getitem__, tokens))
+
+    # Paragraph ends get their own copy so the flag doesn't leak onto other
+    # occurrences of the same token
     for idx in paragraph_end_indices[:-1]:
-        all_words[idx].paragraph_break_after = True
+        all_words[idx] = replace(all_words[idx], paragraph_break_after=True)
 
     return all_words
 
 
+_HTML_SKIP_TAGS = frozenset({
+    'script', 'style', 'nav', 'header', 'footer', 'aside', 'template',
+})
+_HTML_BLOCK_TAGS = frozenset({
+    'p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'li', 'blockquote', 'pre', 'tr', 'br', 'hr',
+    'section', 'article', 'main',
+})
+_INLINE_WS_RE = re.compile(r'[^\S\n]+')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_TRAILING_SPACE_RE = re.compile(r' +\n')
+
+
 def extract_text_from_html(html: str) -> str:
     """Extract readable text from HTML content."""
-    from bs4 import BeautifulSoup, NavigableString
+    from lxml import etree
+
+    if not html.strip():
+        return ""
+
+    root = etree.fromstring(html.encode('utf-8'), etree.HTMLParser(encoding='utf-8'))
+    if root is None:
+        return ""
+
+    # Walk the tree once, pruning unwanted subtrees as we reach them rather
+    # than building the full text and removing elements afterwards.
+    parts: list[str] = []
+    walker = etree.iterwalk(root, events=('start', 'end', 'comment', 'pi'))
+    for event, element in walker:
+        if event != 'start':
+            # Text following an element, comment or processing instruction
+            # belongs to the enclosing element
+            if element.tail:
+                parts.append(element.tail)
+            continue
+        tag = element.tag
+        if tag in _HTML_SKIP_TAGS:
+            walker.skip_subtree()
+            continue
+        if tag in _HTML_BLOCK_TAGS:
+            parts.append('\n\n')
+        if element.text:
+            parts.append(element.text)
+
+    text = ''.join(parts)
+    text = _INLINE_WS_RE.sub(' ', text)
+    text = _BLANK_LINES_RE.sub('\n\n', text)
+    text = _TRAILING_SPACE_RE.sub('\n', text)
+    return text.strip()
 
-    soup = BeautifulSoup(html, 'html.parser')
 
-    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-        element.decompose()
+def read_text_file(filepath: str) -> str:
+    """Read a UTF-8 text file in one read, normalizing line endings."""
+    text = Path(filepath).read_bytes().decode('utf-8', errors='replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
 
-    BLOCK_TAGS = {
-        'p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-        'li', 'blockquote', 'pre', 'tr', 'br', 'hr',
-        'section', 'article', 'main',
-    }
-    for tag in soup.find_all(BLOCK_TAGS):
-        tag.insert_before('\n\n')
 
-    text = soup.get_text()
-    text = re.sub(r'[^\S\n]+', ' ', text)
-    text = re.sub(r'\n\s*\n', '\n\n', text)
-    text = re.sub(r' *\n', '\n', text)
-    return text.strip()
+def load_text_prefix(filepath: str, max_chars: int) -> Optional[str]:
+    """Read up to max_chars characters from the start of a plain text file.
+
+    Only the bytes needed for that many characters are read. Returns None for
+    formats that have to be parsed as a whole (Markdown, HTML, EPUB, PDF).
+    """
+    if Path(filepath).suffix.lower() in ('.md', '.html', '.htm', '.epub', '.pdf'):
+        return None
+    with open(filepath, 'rb') as f:
+        data = f.read(max_chars * 4)
+    # Non-final decode drops a multi-byte character cut off by the read
+    text = codecs.getincrementaldecoder('utf-8')(errors='replace').decode(data)
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text[:max_chars]
 
 
 def load_text_from_file(filepath: str) -> str:
@@ -171,18 +241,15 @@ def load_text_from_file(filepath: str) -> str:
     ext = Path(filepath).suffix.lower()
 
     if ext == '.md':
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return strip_markdown(f.read())
+        return strip_markdown(read_text_file(filepath))
     elif ext in ('.html', '.htm'):
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return extract_text_from_html(f.read())
+        return extract_text_from_html(read_text_file(filepath))
     elif ext == '.epub':
         return load_text_from_epub(filepath)
     elif ext == '.pdf':
         return load_text_from_pdf(filepath)
     else:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
+        return read_text_file(filepath)
 
 
 def load_text_from_epub(filepath: str) -> str:
@@ -230,15 +297,40 @@ def load_text_from_pdf(filepath: str) -> str:
     return '\n\n'.join(pages)
 
 
-def fetch_text_from_url(url: str) -> str:
-    """Fetch and extract text from a URL."""
-    import requests
+# Annotated so the mypyc build does not infer the type None from the
+# initializer and reject the session stored on first use
+_http_session: Optional["requests.Session"] = None
+
+
+def _get_http_session() -> "requests.Session":
+    """Return the shared HTTP session, creating it on first use.
+
+    Reusing one session keeps connections (and TLS sessions) alive between
+    fetches instead of reconnecting for every URL.
+    """
+    global _http_session
+    if _http_session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers['User-Agent'] = (
+            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _http_session = session
+    return _http_session
+
 
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    }
+def fetch_text_from_url(url: str) -> str:
+    """Fetch and extract text from a URL.
 
-    response = requests.get(url, headers=headers, timeout=10)
+    This blocks until the response arrives; GUI code should call it from a
+    background worker.
+    """
+    response = _get_http_session().get(url, timeout=10)
     response.raise_for_status()
 
     return extract_text_from_html(response.text)
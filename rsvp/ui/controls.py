@@ -1,9 +1,13 @@
 """Playback control widgets."""
 from PyQt6.QtWidgets import (
-    QWidget, QHBoxLayout, QVBoxLayout, QPushButton,
+    QApplication, QWidget, QHBoxLayout, QVBoxLayout, QPushButton,
     QSlider, QLabel, QSpinBox, QStyle
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtGui import QIcon
+
+# Slider movements closer together than this are collapsed into one update
+SLIDER_COALESCE_MS = 30
 
 
 class PlaybackControls(QWidget):
@@ -17,20 +21,29 @@ class PlaybackControls(QWidget):
     prev_sentence_clicked = pyqtSignal()
     next_sentence_clicked = pyqtSignal()
 
+    # Standard icons shared by all instances, filled in on first use
+    _icon_cache: dict[QStyle.StandardPixmap, QIcon] = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._is_playing = False
         self._setup_ui()
 
+    @classmethod
+    def _icon(cls, pixmap: QStyle.StandardPixmap) -> QIcon:
+        """Get a standard style icon, creating it only once."""
+        icon = cls._icon_cache.get(pixmap)
+        if icon is None:
+            icon = cls._icon_cache[pixmap] = QApplication.style().standardIcon(pixmap)
+        return icon
+
     def _setup_ui(self):
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 5, 10, 5)
 
-        style = self.style()
-
         # Previous sentence
         self.prev_sentence_btn = QPushButton()
-        self.prev_sentence_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaSkipBackward))
+        self.prev_sentence_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaSkipBackward))
         self.prev_sentence_btn.setToolTip("Previous sentence (Shift+Left)")
         self.prev_sentence_btn.setFixedSize(40, 40)
         self.prev_sentence_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -39,7 +52,7 @@ class PlaybackControls(QWidget):
 
         # Skip backward
         self.skip_back_btn = QPushButton()
-        self.skip_back_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaSeekBackward))
+        self.skip_back_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaSeekBackward))
         self.skip_back_btn.setToolTip("Skip back 10 words (Left)")
         self.skip_back_btn.setFixedSize(40, 40)
         self.skip_back_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -48,7 +61,7 @@ class PlaybackControls(QWidget):
 
         # Play/Pause
         self.play_pause_btn = QPushButton()
-        self.play_pause_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+        self.play_pause_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaPlay))
         self.play_pause_btn.setToolTip("Play/Pause (Space)")
         self.play_pause_btn.setFixedSize(50, 50)
         self.play_pause_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -57,7 +70,7 @@ class PlaybackControls(QWidget):
 
         # Stop
         self.stop_btn = QPushButton()
-        self.stop_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaStop))
+        self.stop_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaStop))
         self.stop_btn.setToolTip("Stop (S)")
         self.stop_btn.setFixedSize(40, 40)
         self.stop_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -66,7 +79,7 @@ class PlaybackControls(QWidget):
 
         # Skip forward
         self.skip_fwd_btn = QPushButton()
-        self.skip_fwd_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaSeekForward))
+        self.skip_fwd_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaSeekForward))
         self.skip_fwd_btn.setToolTip("Skip forward 10 words (Right)")
         self.skip_fwd_btn.setFixedSize(40, 40)
         self.skip_fwd_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -75,7 +88,7 @@ class PlaybackControls(QWidget):
 
         # Next sentence
         self.next_sentence_btn = QPushButton()
-        self.next_sentence_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaSkipForward))
+        self.next_sentence_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaSkipForward))
         self.next_sentence_btn.setToolTip("Next sentence (Shift+Right)")
         self.next_sentence_btn.setFixedSize(40, 40)
         self.next_sentence_btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
@@ -90,12 +103,13 @@ class PlaybackControls(QWidget):
 
     def set_playing(self, is_playing: bool):
         """Update the play/pause button state."""
+        if is_playing == self._is_playing:
+            return
         self._is_playing = is_playing
-        style = self.style()
         if is_playing:
-            self.play_pause_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaPause))
+            self.play_pause_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaPause))
         else:
-            self.play_pause_btn.setIcon(style.standardIcon(QStyle.StandardPixmap.SP_MediaPlay))
+            self.play_pause_btn.setIcon(self._icon(QStyle.StandardPixmap.SP_MediaPlay))
 
 
 class SpeedControl(QWidget):
@@ -105,6 +119,11 @@ class SpeedControl(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._last_emitted_wpm: int | None = None
+        self._slider_timer = QTimer(self)
+        self._slider_timer.setSingleShot(True)
+        self._slider_timer.setInterval(SLIDER_COALESCE_MS)
+        self._slider_timer.timeout.connect(self._on_slider_settled)
         self._setup_ui()
 
     def _setup_ui(self):
@@ -160,17 +179,29 @@ class SpeedControl(QWidget):
         new_val = min(2000, self.spinbox.value() + 25)
         self.set_wpm(new_val)
 
+    def _emit_wpm(self, value: int):
+        """Emit wpm_changed unless the value was already emitted."""
+        self._slider_timer.stop()
+        if value == self._last_emitted_wpm:
+            return
+        self._last_emitted_wpm = value
+        self.wpm_changed.emit(value)
+
     def _on_slider_change(self, value):
         self.spinbox.blockSignals(True)
         self.spinbox.setValue(value)
         self.spinbox.blockSignals(False)
-        self.wpm_changed.emit(value)
+        # Emit once the slider settles rather than on every drag step
+        self._slider_timer.start()
+
+    def _on_slider_settled(self):
+        self._emit_wpm(self.slider.value())
 
     def _on_spinbox_change(self, value):
         self.slider.blockSignals(True)
         self.slider.setValue(min(value, 1000))
         self.slider.blockSignals(False)
-        self.wpm_changed.emit(value)
+        self._emit_wpm(value)
 
     def set_wpm(self, wpm: int):
         """Set the WPM value."""
@@ -180,7 +211,7 @@ class SpeedControl(QWidget):
         self.slider.setValue(min(wpm, 1000))
         self.spinbox.blockSignals(False)
         self.slider.blockSignals(False)
-        self.wpm_changed.emit(wpm)
+        self._emit_wpm(wpm)
 
     def get_wpm(self) -> int:
         """Get the current WPM value."""
@@ -222,18 +253,20 @@ class ProgressWidget(QWidget):
         percent = (self.slider.value() / 1000) * 100
         self.seek_requested.emit(percent)
 
-    def update_progress(self, progress_percent: float, current: int, total: int, time_remaining: float):
-        """Update the progress display."""
+    def update_progress(self, permille: int):
+        """Update the progress slider (0-1000)."""
         self.slider.blockSignals(True)
-        self.slider.setValue(int((progress_percent / 100) * 1000))
+        self.slider.setValue(permille)
         self.slider.blockSignals(False)
 
+    def update_word_count(self, current: int, total: int):
+        """Update the word position label."""
         self.label.setText(f"{current} / {total} words")
 
-        # Format time remaining
+    def update_time_remaining(self, time_remaining: int):
+        """Update the time remaining display (whole seconds)."""
         if time_remaining > 0:
-            minutes = int(time_remaining // 60)
-            seconds = int(time_remaining % 60)
+            minutes, seconds = divmod(time_remaining, 60)
             if minutes > 0:
                 self.time_label.setText(f"{minutes}m {seconds}s left")
             else:
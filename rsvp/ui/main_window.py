@@ -1,18 +1,35 @@
 """Main application window."""
+import os
+import time
+from functools import partial
+
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QStatusBar, QFileDialog, QMessageBox, QLabel
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QStatusBar, QMessageBox, QLabel
 )
-from PyQt6.QtCore import Qt, QEvent
-from PyQt6.QtGui import QAction, QKeySequence, QShortcut
+from PyQt6.QtCore import Qt, QEvent, QTimer, pyqtSlot
+from PyQt6.QtGui import QAction, QKeySequence
 
 from rsvp.core.rsvp_engine import RSVPEngine
 from rsvp.core.settings import get_settings_manager
-from rsvp.core.text_processor import load_text_from_file
+from rsvp.core.text_processor import load_text_from_file, process_text
 from rsvp.ui.word_display import WordDisplayWidget
 from rsvp.ui.controls import PlaybackControls, SpeedControl, ProgressWidget
-from rsvp.ui.text_input_dialog import TextInputDialog
+from rsvp.ui.text_input_dialog import TextInputDialog, pick_text_file
 from rsvp.ui.settings_dialog import SettingsDialog
+from rsvp.ui.workers import TaskWorker
+
+# Files larger than this are read and processed on a worker thread
+LARGE_FILE_BYTES = 5 * 1024 * 1024
+
+# Progress display updates are limited to one per frame at this rate or the
+# screen's refresh rate, whichever is higher
+MIN_REFRESH_HZ = 30
+
+
+def _load_words_from_file(filepath: str):
+    """Read and process a file; runs on a worker thread for large files."""
+    return process_text(load_text_from_file(filepath))
 
 
 class MainWindow(QMainWindow):
@@ -21,10 +38,22 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self._current_file = None
+        self._loading_file = None
+        self._load_worker = None
+        # Menu actions reused across menu refreshes, keyed by file path and
+        # word index, plus what the menus currently show
+        self._recent_actions: dict[str, QAction] = {}
+        self._recent_entries = None
+        self._bookmark_actions: dict[int, QAction] = {}
+        self._bookmarks_key = None
+        self._bookmarks_words = None
+        # Dialogs are built on first use and reused afterwards
+        self._text_dialog = None
+        self._settings_dialog = None
         self._engine = RSVPEngine()
         self._setup_ui()
+        self._setup_progress_throttle()
         self._setup_menus()
-        self._setup_shortcuts()
         self._connect_signals()
         self._load_window_settings()
         self.installEventFilter(self)
@@ -76,8 +105,16 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("No text loaded")
         self.status_bar.addWidget(self.status_label)
 
-        # Apply settings
-        self._apply_settings()
+    def _setup_progress_throttle(self):
+        """Set up coalescing of progress display updates to the frame rate."""
+        refresh_rate = self.screen().refreshRate() if self.screen() else 0
+        self._min_frame_ms = int(1000 / max(MIN_REFRESH_HZ, refresh_rate))
+        self._last_progress_update = 0.0
+        # (index, word count) the progress display last showed
+        self._shown_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
     def _setup_menus(self):
         """Set up the menu bar."""
@@ -85,49 +122,30 @@ class MainWindow(QMainWindow):
 
         # File menu
         file_menu = menubar.addMenu("&File")
-
-        # Load text
-        load_action = QAction("&Load Text...", self)
-        load_action.setShortcut(QKeySequence.StandardKey.Open)
-        load_action.triggered.connect(self._load_text_dialog)
-        file_menu.addAction(load_action)
-
-        # Open file
-        open_action = QAction("&Open File...", self)
-        open_action.setShortcut("Ctrl+Shift+O")
-        open_action.triggered.connect(self._open_file)
-        file_menu.addAction(open_action)
-
-        file_menu.addSeparator()
+        self._add_menu_actions(file_menu, (
+            ("&Load Text...", QKeySequence.StandardKey.Open, self._load_text_dialog),
+            ("&Open File...", "Ctrl+Shift+O", self._open_file),
+            None,
+        ))
 
         # Recent files submenu
         self.recent_menu = file_menu.addMenu("Recent Files")
+        self._no_recent_action = QAction("No recent files", self)
+        self._no_recent_action.setEnabled(False)
         self._update_recent_menu()
 
-        file_menu.addSeparator()
-
-        # Exit
-        exit_action = QAction("E&xit", self)
-        exit_action.setShortcut(QKeySequence.StandardKey.Quit)
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        self._add_menu_actions(file_menu, (
+            None,
+            ("E&xit", QKeySequence.StandardKey.Quit, self.close),
+        ))
 
         # Edit menu
         edit_menu = menubar.addMenu("&Edit")
-
-        # Paste and read
-        paste_action = QAction("&Paste and Read", self)
-        paste_action.setShortcut("Ctrl+V")
-        paste_action.triggered.connect(self._paste_and_read)
-        edit_menu.addAction(paste_action)
-
-        edit_menu.addSeparator()
-
-        # Settings
-        settings_action = QAction("&Settings...", self)
-        settings_action.setShortcut("Ctrl+,")
-        settings_action.triggered.connect(self._show_settings)
-        edit_menu.addAction(settings_action)
+        self._add_menu_actions(edit_menu, (
+            ("&Paste and Read", "Ctrl+V", self._paste_and_read),
+            None,
+            ("&Settings...", "Ctrl+,", self._show_settings),
+        ))
 
         # View menu
         view_menu = menubar.addMenu("&View")
@@ -138,80 +156,72 @@ class MainWindow(QMainWindow):
         self.always_on_top_action.triggered.connect(self._toggle_always_on_top)
         view_menu.addAction(self.always_on_top_action)
 
-        # Fullscreen
-        fullscreen_action = QAction("&Fullscreen", self)
-        fullscreen_action.setShortcut("F11")
-        fullscreen_action.triggered.connect(self._toggle_fullscreen)
-        view_menu.addAction(fullscreen_action)
+        self._add_menu_actions(view_menu, (
+            ("&Fullscreen", "F11", self._toggle_fullscreen),
+        ))
 
         # Playback menu
         playback_menu = menubar.addMenu("&Playback")
-
-        play_action = QAction("&Play/Pause", self)
-        play_action.setShortcut("Space")
-        play_action.triggered.connect(self._engine.toggle_play_pause)
-        playback_menu.addAction(play_action)
-
-        stop_action = QAction("&Stop", self)
-        stop_action.setShortcut("S")
-        stop_action.triggered.connect(self._engine.stop)
-        playback_menu.addAction(stop_action)
-
-        playback_menu.addSeparator()
-
-        speed_up_action = QAction("Speed &Up (+/Up)", self)
-        speed_up_action.triggered.connect(self._speed_up)
-        playback_menu.addAction(speed_up_action)
-
-        speed_down_action = QAction("Speed &Down (-/Down)", self)
-        speed_down_action.triggered.connect(self._speed_down)
-        playback_menu.addAction(speed_down_action)
+        self._add_menu_actions(playback_menu, (
+            ("&Play/Pause", "Space", self._engine.toggle_play_pause),
+            ("&Stop", "S", self._engine.stop),
+            None,
+            ("Speed &Up (+/Up)", None, self._speed_up),
+            ("Speed &Down (-/Down)", None, self._speed_down),
+            None,
+            ("Pre&vious Sentence", "Shift+Left", self._engine.previous_sentence),
+            ("&Next Sentence", "Shift+Right", self._engine.next_sentence),
+            ("Go to Star&t", "Home", self._seek_start),
+            ("Go to &End", "End", self._seek_end),
+        ))
 
         # Bookmarks menu
         bookmarks_menu = menubar.addMenu("&Bookmarks")
-
-        add_bookmark_action = QAction("&Add Bookmark", self)
-        add_bookmark_action.setShortcut("Ctrl+B")
-        add_bookmark_action.triggered.connect(self._add_bookmark)
-        bookmarks_menu.addAction(add_bookmark_action)
-
-        remove_bookmark_action = QAction("&Remove Bookmark", self)
-        remove_bookmark_action.setShortcut("Ctrl+Shift+B")
-        remove_bookmark_action.triggered.connect(self._remove_bookmark)
-        bookmarks_menu.addAction(remove_bookmark_action)
-
-        bookmarks_menu.addSeparator()
+        self._add_menu_actions(bookmarks_menu, (
+            ("&Add Bookmark", "Ctrl+B", self._add_bookmark),
+            ("&Remove Bookmark", "Ctrl+Shift+B", self._remove_bookmark),
+            None,
+        ))
 
         self.bookmarks_submenu = bookmarks_menu.addMenu("Go to Bookmark")
+        self._no_bookmarks_action = QAction("No bookmarks", self)
+        self._no_bookmarks_action.setEnabled(False)
 
         # Help menu
         help_menu = menubar.addMenu("&Help")
-
-        shortcuts_action = QAction("Keyboard &Shortcuts", self)
-        shortcuts_action.setShortcut("F1")
-        shortcuts_action.triggered.connect(self._show_shortcuts)
-        help_menu.addAction(shortcuts_action)
-
-        help_menu.addSeparator()
-
-        about_action = QAction("&About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
-
-    def _setup_shortcuts(self):
-        """Set up keyboard shortcuts."""
-        QShortcut(QKeySequence("Shift+Left"), self, self._engine.previous_sentence)
-        QShortcut(QKeySequence("Shift+Right"), self, self._engine.next_sentence)
-        QShortcut(QKeySequence("Home"), self, lambda: self._engine.seek(0))
-        QShortcut(QKeySequence("End"), self, lambda: self._engine.seek(self._engine.word_count - 1))
+        self._add_menu_actions(help_menu, (
+            ("Keyboard &Shortcuts", "F1", self._show_shortcuts),
+            None,
+            ("&About", None, self._show_about),
+        ))
+
+    def _add_menu_actions(self, menu, entries):
+        """Add (text, shortcut, slot) entries to a menu; None adds a separator."""
+        actions = []
+        for entry in entries:
+            action = QAction(self)
+            if entry is None:
+                action.setSeparator(True)
+            else:
+                text, shortcut, slot = entry
+                action.setText(text)
+                if shortcut is not None:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(slot)
+            actions.append(action)
+        menu.addActions(actions)
 
     def _connect_signals(self):
         """Connect signals between components."""
-        # Engine signals
-        self._engine.word_changed.connect(self._on_word_changed)
-        self._engine.state_changed.connect(self._on_state_changed)
-        self._engine.progress_changed.connect(self._on_progress_changed)
-        self._engine.finished.connect(self._on_finished)
+        # Engine signals. Queued so the engine finishes its tick (including
+        # scheduling the next word) before any UI work runs; widgets only
+        # call update(), so Qt merges the resulting repaints.
+        queued = Qt.ConnectionType.QueuedConnection
+        self._engine.word_changed.connect(self._on_word_changed, queued)
+        self._engine.state_changed.connect(self._on_state_changed, queued)
+        self._engine.progress_changed.connect(self._on_progress_changed, queued)
+        self._engine.seconds_remaining_changed.connect(self._on_seconds_remaining_changed, queued)
+        self._engine.finished.connect(self._on_finished, queued)
 
         # Control signals
         self.playback_controls.play_clicked.connect(self._engine.play)
@@ -278,7 +288,11 @@ class MainWindow(QMainWindow):
                 self._engine.seek(saved_index)
 
     def _load_window_settings(self):
-        """Load window position and size from settings."""
+        """Load window position, size and flags from settings.
+
+        Runs once before the window is first shown, so the stay-on-top flag
+        is in place when the native window is created.
+        """
         settings = get_settings_manager().settings
 
         self.resize(settings.window_width, settings.window_height)
@@ -286,9 +300,8 @@ class MainWindow(QMainWindow):
         if settings.window_x is not None and settings.window_y is not None:
             self.move(settings.window_x, settings.window_y)
 
-        if settings.always_on_top:
-            self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
-            self.always_on_top_action.setChecked(True)
+        self._set_always_on_top(settings.always_on_top)
+        self.always_on_top_action.setChecked(settings.always_on_top)
 
         self.speed_control.set_wpm(settings.wpm)
 
@@ -302,44 +315,83 @@ class MainWindow(QMainWindow):
         settings.window_x = self.x()
         settings.window_y = self.y()
 
-        manager.save()
+        manager.request_save()
 
     def _apply_settings(self):
         """Apply current settings to UI."""
         settings = get_settings_manager().settings
         self.word_display.update_settings()
+        self._set_always_on_top(settings.always_on_top)
 
-        if settings.always_on_top:
-            self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, True)
-        else:
-            self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, False)
-        # setWindowFlag hides the widget; re-show only if already visible
-        if self.isVisible():
+    def _set_always_on_top(self, on_top: bool):
+        """Set the stay-on-top window flag if it differs from the current one.
+
+        Changing the flag recreates the native window and hides it, so this is
+        skipped when nothing changed and the window is re-shown if it was
+        visible.
+        """
+        hint = Qt.WindowType.WindowStaysOnTopHint
+        if bool(self.windowFlags() & hint) == on_top:
+            return
+        was_visible = self.isVisible()
+        self.setWindowFlag(hint, on_top)
+        if was_visible:
             self.show()
 
     def _update_recent_menu(self):
         """Update the recent files menu."""
-        self.recent_menu.clear()
-        settings = get_settings_manager().settings
-
-        for filepath in settings.recent_files:
-            action = QAction(filepath, self)
-            action.triggered.connect(lambda checked, f=filepath: self._load_file(f))
-            self.recent_menu.addAction(action)
-
-        if not settings.recent_files:
-            no_recent = QAction("No recent files", self)
-            no_recent.setEnabled(False)
-            self.recent_menu.addAction(no_recent)
+        entries = [(filepath, filepath) for filepath in get_settings_manager().settings.recent_files]
+        if entries == self._recent_entries:
+            return
+        self._recent_entries = entries
+        self._sync_menu(
+            self.recent_menu, self._recent_actions, entries,
+            self._open_recent_file, self._no_recent_action
+        )
 
+    def _sync_menu(self, menu, actions: dict, entries: list, slot, placeholder: QAction):
+        """Show (key, label) entries in menu, reusing the actions cached by key.
+
+        Actions whose key is no longer listed are deleted and new keys get an
+        action that calls slot(key). The placeholder is shown when there are
+        no entries.
+        """
+        keys = {key for key, _ in entries}
+        for key in [key for key in actions if key not in keys]:
+            actions.pop(key).deleteLater()
+
+        ordered = []
+        for key, label in entries:
+            action = actions.get(key)
+            if action is None:
+                action = QAction(label, self)
+                action.triggered.connect(partial(slot, key))
+                actions[key] = action
+            elif action.text() != label:
+                action.setText(label)
+            ordered.append(action)
+
+        for action in menu.actions():
+            menu.removeAction(action)
+        menu.addActions(ordered or [placeholder])
+
+    def _open_recent_file(self, filepath: str, _checked: bool = False):
+        """Load a file chosen from the recent files menu."""
+        self._load_file(filepath)
+
+    @pyqtSlot()
     def _load_text_dialog(self):
         """Show the text input dialog."""
         self._maybe_save_position()
-        dialog = TextInputDialog(self)
+        if self._text_dialog is None:
+            self._text_dialog = TextInputDialog(self)
+        dialog = self._text_dialog
+        dialog.reset()
         if dialog.exec():
             text = dialog.get_text()
             source = dialog.get_source_path()
 
+            self._cancel_background_load()
             self._engine.load_text(text)
             self._current_file = source
 
@@ -354,75 +406,115 @@ class MainWindow(QMainWindow):
             self.status_label.setText(f"Loaded {self._engine.word_count} words")
             self._maybe_resume_position(source)
 
+    @pyqtSlot()
     def _open_file(self):
         """Open a file directly."""
-        filepath, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open File",
-            "",
-            "All Supported (*.txt *.md *.html *.htm *.epub *.pdf);;"
-            "Text (*.txt);;"
-            "Markdown (*.md);;"
-            "HTML (*.html *.htm);;"
-            "EPUB (*.epub);;"
-            "PDF (*.pdf);;"
-            "All Files (*)"
-        )
-
+        filepath = pick_text_file(self)
         if filepath:
             self._load_file(filepath)
 
     def _load_file(self, filepath: str):
         """Load a file."""
         self._maybe_save_position()
+        self._cancel_background_load()
         try:
+            if os.path.getsize(filepath) > LARGE_FILE_BYTES:
+                self._load_file_in_background(filepath)
+                return
             text = load_text_from_file(filepath)
             self._engine.load_text(text)
-            self._current_file = filepath
-
-            get_settings_manager().add_recent_file(filepath)
-            self._update_recent_menu()
-            self._update_bookmarks_menu()
-
-            self.setWindowTitle(f"RSVP Reader - {filepath}")
-            self.status_label.setText(f"Loaded {self._engine.word_count} words")
-            self._maybe_resume_position(filepath)
+            self._on_file_loaded(filepath)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to load file: {e}")
 
+    def _load_file_in_background(self, filepath: str):
+        """Read and process a large file on the thread pool."""
+        self._loading_file = filepath
+        self._load_worker = TaskWorker(_load_words_from_file, filepath)
+        self._load_worker.signals.finished.connect(self._on_background_load_finished)
+        self._load_worker.signals.failed.connect(self._on_background_load_failed)
+        self._load_worker.start()
+        self.status_label.setText(f"Loading {filepath}...")
+
+    def _cancel_background_load(self):
+        """Discard the result of any background load still in progress."""
+        self._loading_file = None
+        self._load_worker = None
+
+    def _take_background_load(self) -> str | None:
+        """Claim the finished background load, or None if it was superseded."""
+        if self._load_worker is None or self.sender() is not self._load_worker.signals:
+            return None
+        filepath = self._loading_file
+        self._cancel_background_load()
+        return filepath
+
+    @pyqtSlot(object)
+    def _on_background_load_finished(self, words):
+        """Show the words from a background file load."""
+        filepath = self._take_background_load()
+        if filepath is None:
+            return
+        self._engine.load_words(words)
+        self._on_file_loaded(filepath)
+
+    @pyqtSlot(str)
+    def _on_background_load_failed(self, message: str):
+        """Report a failed background file load."""
+        if self._take_background_load() is None:
+            return
+        self.status_label.setText("No text loaded")
+        QMessageBox.warning(self, "Error", f"Failed to load file: {message}")
+
+    def _on_file_loaded(self, filepath: str):
+        """Update window state after a file's words are loaded."""
+        self._current_file = filepath
+
+        get_settings_manager().add_recent_file(filepath)
+        self._update_recent_menu()
+        self._update_bookmarks_menu()
+
+        self.setWindowTitle(f"RSVP Reader - {filepath}")
+        self.status_label.setText(f"Loaded {self._engine.word_count} words")
+        self._maybe_resume_position(filepath)
+
+    @pyqtSlot()
     def _paste_and_read(self):
         """Paste from clipboard and start reading."""
-        try:
-            import pyperclip
-            text = pyperclip.paste()
-        except Exception:
-            from PyQt6.QtWidgets import QApplication
-            text = QApplication.clipboard().text()
+        text = QApplication.clipboard().text()
 
         if text:
+            self._cancel_background_load()
             self._engine.load_text(text)
             self._current_file = None
             self.setWindowTitle("RSVP Reader - Clipboard")
             self.status_label.setText(f"Loaded {self._engine.word_count} words from clipboard")
             self._engine.play()
 
+    @pyqtSlot()
     def _show_settings(self):
         """Show the settings dialog."""
-        dialog = SettingsDialog(self)
-        if dialog.exec():
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self)
+        else:
+            self._settings_dialog.reload()
+        if self._settings_dialog.exec():
             self._apply_settings()
-            self.speed_control.set_wpm(get_settings_manager().settings.wpm)
+            wpm = get_settings_manager().settings.wpm
+            if wpm != self.speed_control.get_wpm():
+                self.speed_control.set_wpm(wpm)
 
+    @pyqtSlot()
     def _toggle_always_on_top(self):
         """Toggle always on top."""
         on_top = self.always_on_top_action.isChecked()
-        self.setWindowFlag(Qt.WindowType.WindowStaysOnTopHint, on_top)
-        self.show()
+        self._set_always_on_top(on_top)
 
         settings = get_settings_manager()
         settings.settings.always_on_top = on_top
-        settings.save()
+        settings.request_save()
 
+    @pyqtSlot()
     def _toggle_fullscreen(self):
         """Toggle fullscreen mode."""
         if self.isFullScreen():
@@ -430,16 +522,29 @@ class MainWindow(QMainWindow):
         else:
             self.showFullScreen()
 
+    @pyqtSlot()
+    def _seek_start(self):
+        """Jump to the first word."""
+        self._engine.seek(0)
+
+    @pyqtSlot()
+    def _seek_end(self):
+        """Jump to the last word."""
+        self._engine.seek(self._engine.word_count - 1)
+
+    @pyqtSlot()
     def _speed_up(self):
         """Increase WPM."""
         new_wpm = min(2000, self._engine.wpm + 25)
         self.speed_control.set_wpm(new_wpm)
 
+    @pyqtSlot()
     def _speed_down(self):
         """Decrease WPM."""
         new_wpm = max(50, self._engine.wpm - 25)
         self.speed_control.set_wpm(new_wpm)
 
+    @pyqtSlot()
     def _add_bookmark(self):
         """Add a bookmark at current position."""
         if not self._current_file:
@@ -456,19 +561,21 @@ class MainWindow(QMainWindow):
         self._update_bookmarks_menu()
         self.status_label.setText(f"Bookmark added at word {self._engine.current_index}")
 
+    @pyqtSlot()
     def _remove_bookmark(self):
         """Remove the bookmark at or nearest to the current position."""
         if not self._current_file:
             return
 
-        bookmarks = get_settings_manager().get_bookmarks(self._current_file)
+        manager = get_settings_manager()
+        bookmarks = manager.get_bookmarks(self._current_file)
         if not bookmarks:
             self.status_label.setText("No bookmarks to remove")
             return
 
         current = self._engine.current_index
         if current in bookmarks:
-            get_settings_manager().remove_bookmark(self._current_file, current)
+            manager.remove_bookmark(self._current_file, current)
             self._update_bookmarks_menu()
             self.status_label.setText(f"Bookmark removed at word {current}")
         else:
@@ -476,32 +583,34 @@ class MainWindow(QMainWindow):
 
     def _update_bookmarks_menu(self):
         """Update the bookmarks submenu."""
-        self.bookmarks_submenu.clear()
-
-        if not self._current_file:
-            no_bookmarks = QAction("No bookmarks", self)
-            no_bookmarks.setEnabled(False)
-            self.bookmarks_submenu.addAction(no_bookmarks)
-            return
-
-        bookmarks = get_settings_manager().get_bookmarks(self._current_file)
-
-        if not bookmarks:
-            no_bookmarks = QAction("No bookmarks", self)
-            no_bookmarks.setEnabled(False)
-            self.bookmarks_submenu.addAction(no_bookmarks)
+        words = self._engine.state.words
+        indices = ()
+        if self._current_file:
+            indices = tuple(get_settings_manager().get_bookmarks(self._current_file))
+        # Labels quote the words, so a reload of the same file also counts as a change
+        key = (self._current_file, indices)
+        if key == self._bookmarks_key and words is self._bookmarks_words:
             return
+        self._bookmarks_key = key
+        self._bookmarks_words = words
 
-        words = self._engine.state.words
-        for idx in bookmarks:
+        entries = []
+        for idx in indices:
             if idx < len(words):
                 label = f"Word {idx}: \"{words[idx].text}\""
             else:
                 label = f"Word {idx}"
-            action = QAction(label, self)
-            action.triggered.connect(lambda checked, i=idx: self._engine.seek(i))
-            self.bookmarks_submenu.addAction(action)
+            entries.append((idx, label))
+        self._sync_menu(
+            self.bookmarks_submenu, self._bookmark_actions, entries,
+            self._go_to_bookmark, self._no_bookmarks_action
+        )
+
+    def _go_to_bookmark(self, index: int, _checked: bool = False):
+        """Seek to a bookmark chosen from the bookmarks menu."""
+        self._engine.seek(index)
 
+    @pyqtSlot()
     def _show_shortcuts(self):
         """Show keyboard shortcuts help."""
         shortcuts = """
@@ -524,6 +633,7 @@ class MainWindow(QMainWindow):
 """
         QMessageBox.information(self, "Keyboard Shortcuts", shortcuts)
 
+    @pyqtSlot()
     def _show_about(self):
         """Show about dialog."""
         QMessageBox.about(
@@ -536,28 +646,62 @@ class MainWindow(QMainWindow):
             "Point (ORP) highlighted, allowing for faster reading speeds.</p>"
         )
 
+    @pyqtSlot(object)
     def _on_word_changed(self, word):
         """Handle word changed signal."""
         self.word_display.set_word(word)
+        self._schedule_progress_update()
 
+    @pyqtSlot()
     def _on_state_changed(self):
         """Handle state changed signal."""
         self.playback_controls.set_playing(self._engine.is_playing)
 
-    def _on_progress_changed(self, progress: float):
+    @pyqtSlot(int)
+    def _on_progress_changed(self, permille: int):
         """Handle progress changed signal."""
+        self._schedule_progress_update()
+
+    def _schedule_progress_update(self):
+        """Update the progress display at most once per frame.
+
+        Updates arriving within a frame of the last one are deferred to a
+        timer that shows the latest position, so none is lost. The first and
+        last word are always shown immediately. word_changed and
+        progress_changed both arrive for the same advance; whichever comes
+        second finds the position already shown and does nothing.
+        """
         state = self._engine.state
-        self.progress_widget.update_progress(
-            progress,
-            state.current_index,
-            len(state.words),
-            state.time_remaining_seconds
-        )
+        if (state.current_index, len(state.words)) == self._shown_progress:
+            return
+        elapsed_ms = (time.monotonic() - self._last_progress_update) * 1000
+        at_boundary = state.current_index in (0, len(state.words) - 1)
+        if at_boundary or elapsed_ms >= self._min_frame_ms:
+            self._flush_progress()
+        elif not self._progress_timer.isActive():
+            self._progress_timer.start(max(1, round(self._min_frame_ms - elapsed_ms)))
+
+    @pyqtSlot()
+    def _flush_progress(self):
+        """Show the engine's current position in the progress display."""
+        self._progress_timer.stop()
+        self._last_progress_update = time.monotonic()
+        state = self._engine.state
+        self._shown_progress = (state.current_index, len(state.words))
+        self.progress_widget.update_progress(state.progress_permille)
+        self.progress_widget.update_word_count(state.current_index, len(state.words))
+
+    @pyqtSlot(int)
+    def _on_seconds_remaining_changed(self, seconds: int):
+        """Handle seconds remaining changed signal."""
+        self.progress_widget.update_time_remaining(seconds)
 
+    @pyqtSlot(int)
     def _on_wpm_changed(self, wpm):
         """Handle WPM changed signal."""
         self._engine.wpm = wpm
 
+    @pyqtSlot()
     def _on_finished(self):
         """Handle finished signal."""
         self.status_label.setText("Finished reading")
@@ -578,4 +722,6 @@ class MainWindow(QMainWindow):
         """Handle window close."""
         self._maybe_save_position()
         self._save_window_settings()
+        # Write out everything still waiting on the save delay
+        get_settings_manager().flush()
         event.accept()
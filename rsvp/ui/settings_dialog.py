@@ -7,7 +7,8 @@ from PyQt6.QtWidgets import (
     QColorDialog, QFontComboBox, QCheckBox,
     QDialogButtonBox
 )
-from PyQt6.QtGui import QColor, QFont
+from PyQt6.QtCore import pyqtSlot
+from PyQt6.QtGui import QColor, QFont, QPalette
 
 from rsvp.core.settings import get_settings_manager
 
@@ -18,17 +19,24 @@ class ColorButton(QPushButton):
     def __init__(self, color: str, parent=None):
         super().__init__(parent)
         self._color = QColor(color)
+        # Colors go through the palette so a change doesn't re-parse a stylesheet
+        self.setAutoFillBackground(True)
+        self.setMinimumSize(80, 25)
         self._update_style()
         self.clicked.connect(self._pick_color)
 
     def _update_style(self):
-        self.setStyleSheet(
-            f"background-color: {self._color.name()}; "
-            f"color: {'white' if self._color.lightness() < 128 else 'black'}; "
-            f"min-width: 80px; min-height: 25px;"
+        color = self._color
+        pal = self.palette()
+        pal.setColor(QPalette.ColorRole.Button, color)
+        pal.setColor(
+            QPalette.ColorRole.ButtonText,
+            QColor("white" if color.lightness() < 128 else "black"),
         )
-        self.setText(self._color.name())
+        self.setPalette(pal)
+        self.setText(color.name())
 
+    @pyqtSlot()
     def _pick_color(self):
         color = QColorDialog.getColor(self._color, self, "Select Color")
         if color.isValid():
@@ -51,6 +59,10 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Settings")
         self.setMinimumWidth(450)
         self._setup_ui()
+        self.reload()
+
+    def reload(self):
+        """Show the current settings; call before each reuse of the dialog."""
         self._load_settings()
         # Snapshot for rollback if user clicks Apply then Cancel
         self._original_settings = asdict(get_settings_manager().settings)
@@ -135,6 +147,7 @@ class SettingsDialog(QDialog):
         self.pause_paragraphs_check.setChecked(settings.pause_at_paragraphs)
         self.auto_save_check.setChecked(settings.auto_save_position)
 
+    @pyqtSlot()
     def _apply(self):
         """Apply settings without closing."""
         manager = get_settings_manager()
@@ -150,8 +163,9 @@ class SettingsDialog(QDialog):
         settings.pause_at_paragraphs = self.pause_paragraphs_check.isChecked()
         settings.auto_save_position = self.auto_save_check.isChecked()
 
-        manager.save()
+        manager.request_save()
 
+    @pyqtSlot()
     def _save_and_accept(self):
         """Save settings and close."""
         self._apply()
@@ -163,5 +177,5 @@ class SettingsDialog(QDialog):
         for key, value in self._original_settings.items():
             if hasattr(manager.settings, key):
                 setattr(manager.settings, key, value)
-        manager.save()
+        manager.request_save()
         super().reject()
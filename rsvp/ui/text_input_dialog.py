@@ -1,12 +1,49 @@
 """Dialog for text input."""
+import os
+
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
+    QApplication, QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
     QWidget, QTextEdit, QLineEdit, QPushButton,
     QLabel, QFileDialog, QMessageBox
 )
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import pyqtSlot
+
+from rsvp.core.settings import get_settings_manager
+from rsvp.core.text_processor import load_text_from_file, load_text_prefix, fetch_text_from_url
+from rsvp.ui.workers import TaskWorker
+
+# Characters of a file or page shown in the preview boxes
+PREVIEW_CHARS = 5000
+
+OPEN_FILE_FILTER = (
+    "All Supported (*.txt *.md *.html *.htm *.epub *.pdf);;"
+    "Text (*.txt);;"
+    "Markdown (*.md);;"
+    "HTML (*.html *.htm);;"
+    "EPUB (*.epub);;"
+    "PDF (*.pdf);;"
+    "All Files (*)"
+)
+
+
+def pick_text_file(parent) -> str | None:
+    """Ask for a file to read, starting in the last directory one was opened from.
 
-from rsvp.core.text_processor import load_text_from_file, fetch_text_from_url
+    Returns None if the dialog was cancelled.
+    """
+    manager = get_settings_manager()
+    filepath, _ = QFileDialog.getOpenFileName(
+        parent, "Open File", manager.settings.last_open_dir, OPEN_FILE_FILTER
+    )
+    if not filepath:
+        return None
+    manager.set_last_open_dir(os.path.dirname(filepath))
+    return filepath
+
+
+def _preview_text(text: str) -> str:
+    """Truncate text for a preview box, marking that more follows."""
+    return text[:PREVIEW_CHARS] + ("..." if len(text) > PREVIEW_CHARS else "")
 
 
 class TextInputDialog(QDialog):
@@ -18,7 +55,10 @@ class TextInputDialog(QDialog):
         self.setMinimumSize(600, 400)
         self._text = ""
         self._source_path = None
-        self._url_text_truncated = False
+        self._file_text = ""
+        self._url_text = ""
+        self._fetch_worker = None
+        self._fetching_url = ""
         self._setup_ui()
 
     def _setup_ui(self):
@@ -77,9 +117,9 @@ class TextInputDialog(QDialog):
         self.url_edit.setPlaceholderText("https://example.com/article")
         url_row.addWidget(self.url_edit)
 
-        fetch_btn = QPushButton("Fetch")
-        fetch_btn.clicked.connect(self._fetch_url)
-        url_row.addWidget(fetch_btn)
+        self.fetch_btn = QPushButton("Fetch")
+        self.fetch_btn.clicked.connect(self._fetch_url)
+        url_row.addWidget(self.fetch_btn)
 
         url_layout.addLayout(url_row)
 
@@ -111,61 +151,89 @@ class TextInputDialog(QDialog):
 
         layout.addLayout(btn_layout)
 
+    def reset(self):
+        """Clear all inputs so the dialog can be shown again."""
+        self.text_edit.clear()
+        self.file_path_edit.clear()
+        self.file_preview.clear()
+        self.url_edit.clear()
+        self.url_preview.clear()
+        self.fetch_btn.setEnabled(True)
+        self._text = ""
+        self._source_path = None
+        self._file_text = ""
+        self._url_text = ""
+        self._fetch_worker = None
+        self._fetching_url = ""
+
+    @pyqtSlot()
     def _paste_from_clipboard(self):
         """Paste text from clipboard."""
-        try:
-            import pyperclip
-            text = pyperclip.paste()
-            if text:
-                self.text_edit.setPlainText(text)
-        except Exception:
-            # Fallback to Qt clipboard
-            from PyQt6.QtWidgets import QApplication
-            clipboard = QApplication.clipboard()
-            self.text_edit.setPlainText(clipboard.text())
+        text = QApplication.clipboard().text()
+        if text:
+            self.text_edit.setPlainText(text)
 
+    @pyqtSlot()
     def _browse_file(self):
         """Open file browser."""
-        filepath, _ = QFileDialog.getOpenFileName(
-            self,
-            "Open File",
-            "",
-            "All Supported (*.txt *.md *.html *.htm *.epub *.pdf);;"
-            "Text (*.txt);;"
-            "Markdown (*.md);;"
-            "HTML (*.html *.htm);;"
-            "EPUB (*.epub);;"
-            "PDF (*.pdf);;"
-            "All Files (*)"
-        )
-
+        filepath = pick_text_file(self)
         if filepath:
             try:
-                text = load_text_from_file(filepath)
+                # Plain text is only read in full on OK; other formats have
+                # to be parsed whole for the preview, so keep that text
+                text = load_text_prefix(filepath, PREVIEW_CHARS + 1)
+                if text is None:
+                    text = self._file_text = load_text_from_file(filepath)
+                else:
+                    self._file_text = None
                 self.file_path_edit.setText(filepath)
-                self.file_preview.setPlainText(text[:5000] + ("..." if len(text) > 5000 else ""))
+                self.file_preview.setPlainText(_preview_text(text))
                 self._source_path = filepath
             except Exception as e:
                 QMessageBox.warning(self, "Error", f"Failed to load file: {e}")
 
+    @pyqtSlot()
     def _fetch_url(self):
-        """Fetch text from URL."""
+        """Fetch text from URL on the thread pool."""
         url = self.url_edit.text().strip()
         if not url:
             return
 
-        from PyQt6.QtWidgets import QApplication
-        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-        try:
-            text = fetch_text_from_url(url)
-            self._url_text_truncated = len(text) > 5000
-            self.url_preview.setPlainText(text[:5000] + ("..." if self._url_text_truncated else ""))
-            self._source_path = url
-        except Exception as e:
-            QMessageBox.warning(self, "Error", f"Failed to fetch URL: {e}")
-        finally:
-            QApplication.restoreOverrideCursor()
+        self._url_text = ""
+        self.url_preview.setPlainText("Fetching...")
+        self.fetch_btn.setEnabled(False)
+        self._fetch_worker = TaskWorker(fetch_text_from_url, url)
+        self._fetch_worker.signals.finished.connect(self._on_url_fetched)
+        self._fetch_worker.signals.failed.connect(self._on_url_fetch_failed)
+        self._fetch_worker.start()
+        self._fetching_url = url
+
+    def _take_fetch(self) -> bool:
+        """Claim the finished fetch, or False if it was superseded."""
+        if self._fetch_worker is None or self.sender() is not self._fetch_worker.signals:
+            return False
+        self._fetch_worker = None
+        self.fetch_btn.setEnabled(True)
+        return True
+
+    @pyqtSlot(object)
+    def _on_url_fetched(self, text: str):
+        """Show the text fetched from the URL."""
+        if not self._take_fetch():
+            return
+        self._url_text = text
+        self._source_path = self._fetching_url
+        self.url_preview.setPlainText(_preview_text(text))
+
+    @pyqtSlot(str)
+    def _on_url_fetch_failed(self, message: str):
+        """Report a failed URL fetch."""
+        if not self._take_fetch():
+            return
+        self.url_preview.clear()
+        QMessageBox.warning(self, "Error", f"Failed to fetch URL: {message}")
 
+    @pyqtSlot()
     def _accept(self):
         """Accept the dialog and set the text."""
         current_tab = self.tabs.currentIndex()
@@ -174,24 +242,21 @@ class TextInputDialog(QDialog):
             self._text = self.text_edit.toPlainText()
             self._source_path = None
         elif current_tab == 1:  # File
-            if self.file_path_edit.text():
+            filepath = self.file_path_edit.text()
+            if self._file_text is None:
                 try:
-                    self._text = load_text_from_file(self.file_path_edit.text())
+                    self._file_text = load_text_from_file(filepath)
                 except Exception as e:
                     QMessageBox.warning(self, "Error", f"Failed to load file: {e}")
                     return
-            else:
-                self._text = ""
+            self._text = self._file_text
+            if filepath:
+                self._source_path = filepath
         else:  # URL
-            if self._url_text_truncated:
-                # Preview was truncated, fetch full text
-                try:
-                    self._text = fetch_text_from_url(self.url_edit.text().strip())
-                except Exception as e:
-                    QMessageBox.warning(self, "Error", f"Failed to fetch URL: {e}")
-                    return
-            else:
-                self._text = self.url_preview.toPlainText()
+            if self._fetch_worker is not None:
+                QMessageBox.information(self, "Fetching", "The page is still loading.")
+                return
+            self._text = self._url_text
 
         if self._text.strip():
             self.accept()
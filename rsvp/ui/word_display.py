@@ -1,10 +1,16 @@
 """Word display widget with ORP highlighting."""
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
-from PyQt6.QtGui import QFont, QPainter, QColor, QFontMetrics
+from PyQt6.QtCore import QPointF, QRect
+from PyQt6.QtGui import (
+    QFont, QPainter, QColor, QFontMetrics, QTextCharFormat, QTextLayout,
+)
 
 from rsvp.core.text_processor import Word
 from rsvp.core.settings import get_settings_manager
 
+# Words whose layouts are kept before the cache is cleared
+LAYOUT_CACHE_SIZE = 2048
+
 
 class ORPWordDisplay(QWidget):
     """Widget that displays a word with ORP (Optimal Recognition Point) highlighting."""
@@ -12,35 +18,136 @@ class ORPWordDisplay(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._word: Word | None = None
-        self._font = QFont("Arial", 48)
+        # Shaped and colored layouts of recent words in the current font,
+        # with the x of the ORP character's center
+        self._layout_cache: dict[tuple[str, int], tuple[QTextLayout, float]] = {}
+        # Horizontal band holding the word and indicator line, which is all a
+        # word change needs to repaint
+        self._word_rect = QRect()
+        self._set_font(QFont("Arial", 48))
         self._text_color = QColor("#FFFFFF")
         self._orp_color = QColor("#FF6B6B")
         self._bg_color = QColor("#1E1E1E")
+        self._update_formats()
+        # Display settings the font and the colors were last built from
+        self._font_key = None
+        self._colors_key = None
 
         self.setMinimumHeight(120)
         self._load_settings()
 
-    def _load_settings(self):
-        """Load display settings."""
+    def _load_settings(self) -> bool:
+        """Load display settings, returning False if they were unchanged."""
         settings = get_settings_manager().settings
-        self._font = QFont(settings.font_family, settings.font_size)
-        self._text_color = QColor(settings.text_color)
-        self._orp_color = QColor(settings.orp_color)
-        self._bg_color = QColor(settings.background_color)
+        changed = False
+
+        font_key = (settings.font_family, settings.font_size)
+        if font_key != self._font_key:
+            self._font_key = font_key
+            # Update the font in place rather than building a new one
+            self._font.setFamily(settings.font_family)
+            self._font.setPointSize(settings.font_size)
+            self._set_font(self._font)
+            changed = True
+
+        colors_key = (settings.text_color, settings.orp_color, settings.background_color)
+        if colors_key != self._colors_key:
+            self._colors_key = colors_key
+            self._text_color = QColor(settings.text_color)
+            self._orp_color = QColor(settings.orp_color)
+            self._bg_color = QColor(settings.background_color)
+            self._update_formats()
+            changed = True
+
+        return changed
+
+    def _update_formats(self):
+        """Rebuild the character formats the text and ORP colors are drawn in."""
+        self._text_format = QTextCharFormat()
+        self._text_format.setForeground(self._text_color)
+        self._orp_format = QTextCharFormat()
+        self._orp_format.setForeground(self._orp_color)
+        # Cached layouts carry the old colors
+        self._layout_cache.clear()
+
+    def _set_font(self, font: QFont):
+        """Use font for drawing, dropping metrics measured in the old one."""
+        self._font = font
+        fm = QFontMetrics(font)
+        self._ascent = fm.ascent()
+        self._indicator_height = fm.height() + 20
+        self._update_word_rect()
+        self._layout_cache.clear()
+
+    def _update_word_rect(self):
+        """Recompute the band set_word repaints from the size and font."""
+        # Descenders of large fonts can reach past the indicator line, so allow
+        # a full indicator height (a line height plus margin) on either side
+        half = self._indicator_height
+        center_y = self.height() // 2
+        self._word_rect = QRect(0, center_y - half, self.width(), 2 * half + 1)
+
+    def resizeEvent(self, event):
+        """Keep the word band centered in the new size."""
+        self._update_word_rect()
+        super().resizeEvent(event)
+
+    def _layout(self, word: Word) -> tuple[QTextLayout, float]:
+        """Get the laid-out word and the x of its ORP character's center.
+
+        The whole word is shaped once, with the ORP character given its own
+        color through a format range, so repaints only draw the glyphs.
+        """
+        key = (word.text, word.orp_index)
+        layout = self._layout_cache.get(key)
+        if layout is None:
+            cache = self._layout_cache
+            if len(cache) >= LAYOUT_CACHE_SIZE:
+                cache.clear()
+            orp_index = word.orp_index
+            text_layout = QTextLayout(word.text, self._font)
+            text_layout.setFormats(self._format_ranges(orp_index, len(word.text)))
+            text_layout.beginLayout()
+            line = text_layout.createLine()
+            text_layout.endLayout()
+            orp_left = line.cursorToX(orp_index)[0]
+            orp_right = line.cursorToX(orp_index + 1)[0]
+            layout = cache[key] = (text_layout, (orp_left + orp_right) / 2)
+        return layout
+
+    def _format_ranges(self, orp_index: int, length: int) -> list:
+        """Color the text before and after the ORP character apart from it."""
+        ranges = []
+        for start, end, fmt in (
+            (0, orp_index, self._text_format),
+            (orp_index, orp_index + 1, self._orp_format),
+            (orp_index + 1, length, self._text_format),
+        ):
+            if end > start:
+                format_range = QTextLayout.FormatRange()
+                format_range.start = start
+                format_range.length = end - start
+                format_range.format = fmt
+                ranges.append(format_range)
+        return ranges
 
     def update_settings(self):
-        """Reload settings and repaint."""
-        self._load_settings()
-        self.update()
+        """Reload settings and repaint if any display setting changed."""
+        if self._load_settings():
+            self.update()
 
     def set_word(self, word: Word | None):
         """Set the word to display."""
         self._word = word
-        self.update()
+        # Only the word band changes; the rest of the widget is background
+        self.update(self._word_rect)
 
     def set_font_size(self, size: int):
         """Set the font size."""
         self._font.setPointSize(size)
+        self._set_font(self._font)
+        # The font no longer matches the settings, so the next reload rebuilds it
+        self._font_key = None
         self.update()
 
     def paintEvent(self, event):
@@ -48,54 +155,33 @@ class ORPWordDisplay(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # Fill background
-        painter.fillRect(self.rect(), self._bg_color)
+        # Fill background, limited to the area being repainted
+        painter.fillRect(event.rect(), self._bg_color)
 
-        if not self._word:
+        word = self._word
+        if not word:
             painter.end()
             return
 
         painter.setFont(self._font)
-        fm = QFontMetrics(self._font)
-
-        # Calculate text dimensions
-        text = self._word.text
-        before = self._word.before_orp
-        orp_char = self._word.orp_char
-        after = self._word.after_orp
 
-        # Calculate widths
-        before_width = fm.horizontalAdvance(before)
-        orp_width = fm.horizontalAdvance(orp_char)
+        text_layout, orp_center = self._layout(word)
 
         # Calculate positions - center the ORP character
         center_x = self.width() // 2
         center_y = self.height() // 2
 
         # Draw ORP indicator line (vertical red line at center)
-        indicator_height = fm.height() + 20
+        indicator_height = self._indicator_height
         painter.setPen(self._orp_color)
         painter.drawLine(center_x, center_y - indicator_height // 2,
                         center_x, center_y + indicator_height // 2)
 
-        # Position text so ORP char is centered
-        text_y = center_y + fm.ascent() // 2
-
-        # Calculate x position so ORP character is centered
-        orp_center = before_width + orp_width // 2
-        text_x = center_x - orp_center
-
-        # Draw before ORP
-        painter.setPen(self._text_color)
-        painter.drawText(int(text_x), int(text_y), before)
-
-        # Draw ORP character in highlight color
-        painter.setPen(self._orp_color)
-        painter.drawText(int(text_x + before_width), int(text_y), orp_char)
-
-        # Draw after ORP
-        painter.setPen(self._text_color)
-        painter.drawText(int(text_x + before_width + orp_width), int(text_y), after)
+        # Position text so ORP char is centered; the layout is placed by its
+        # top edge rather than its baseline
+        ascent = self._ascent
+        text_y = center_y + ascent // 2 - ascent
+        text_layout.draw(painter, QPointF(center_x - orp_center, text_y))
 
         painter.end()
 
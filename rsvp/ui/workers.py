@@ -0,0 +1,35 @@
+"""Background workers for running slow operations off the GUI thread."""
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """Signals reporting the outcome of a TaskWorker."""
+
+    finished = pyqtSignal(object)  # Emits the task's return value
+    failed = pyqtSignal(str)  # Emits the error message
+
+
+class TaskWorker(QRunnable):
+    """Run a callable on the global thread pool and report back via signals.
+
+    Signals are delivered to receivers on the GUI thread through queued
+    connections, so slots can touch widgets directly.
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.signals = WorkerSignals()
+        self._fn = fn
+        self._args = args
+
+    def start(self):
+        """Submit the task to the global thread pool."""
+        QThreadPool.globalInstance().start(self)
+
+    def run(self):
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
@@ -1,30 +1,41 @@
+import os
+
 from setuptools import setup, find_packages
 
+# Optionally compile the pure-Python text processing module with mypyc
+# (RSVP_MYPYC=1 pip install .). Requires mypy at build time; the engine and
+# UI modules subclass Qt types and stay interpreted. Module-level globals
+# that are reassigned at runtime need a type annotation, or mypyc infers the
+# type of their initializer (e.g. None) and rejects later values.
+ext_modules = []
+if os.environ.get("RSVP_MYPYC") == "1":
+    from mypyc.build import mypycify
+    ext_modules = mypycify(["--ignore-missing-imports", "rsvp/core/text_processor.py"])
+
 setup(
     name="rsvp-reader",
     version="1.0.0",
     description="Rapid Serial Visual Presentation (RSVP) speed reading application",
     author="RSVP Team",
     packages=find_packages(),
+    ext_modules=ext_modules,
     install_requires=[
         "PyQt6>=6.4.0",
         "requests>=2.28.0",
-        "beautifulsoup4>=4.11.0",
-        "pyperclip>=1.8.0",
+        "lxml>=4.6.0",
     ],
     entry_points={
         "console_scripts": [
             "rsvp=rsvp.main:main",
         ],
     },
-    python_requires=">=3.9",
+    python_requires=">=3.10",
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: End Users/Desktop",
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
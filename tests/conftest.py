@@ -1,6 +1,12 @@
 """Pytest configuration and fixtures."""
+import os
+
 import pytest
 
+# Run Qt headless unless a platform was chosen explicitly, so the suite needs
+# no display server. Must be set before any QApplication is created.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
 
 @pytest.fixture(scope="session")
 def qapp():
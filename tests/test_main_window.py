@@ -0,0 +1,122 @@
+"""Tests for main_window module."""
+import threading
+
+import pytest
+
+from rsvp.core import settings
+from rsvp.core.settings import RSVPSettings, SettingsManager
+from rsvp.ui import main_window
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Install a settings manager backed by a temp config path."""
+    mgr = SettingsManager.__new__(SettingsManager)
+    mgr._settings = RSVPSettings()
+    mgr._settings_were_reset = False
+    mgr._dirty = False
+    mgr._save_timer = None
+    mgr._config_path = tmp_path / "settings.json"
+    monkeypatch.setattr(settings, "_settings_manager", mgr)
+    return mgr
+
+
+@pytest.fixture
+def warnings(monkeypatch):
+    """Record the window's warnings instead of blocking on a modal box."""
+    shown = []
+    monkeypatch.setattr(
+        main_window.QMessageBox, "warning",
+        lambda parent, title, text: shown.append(text),
+    )
+    return shown
+
+
+@pytest.fixture
+def window(manager, warnings, qtbot):
+    win = main_window.MainWindow()
+    qtbot.addWidget(win)
+    return win
+
+
+class TestBackgroundFileLoad:
+    """Tests for loading large files on the thread pool."""
+
+    @pytest.fixture
+    def gates(self, monkeypatch):
+        """Send every file through the background load, held until its gate is set."""
+        gates: dict[str, threading.Event] = {}
+        load_words = main_window._load_words_from_file
+
+        def gated_load_words(filepath):
+            gate = gates.get(filepath)
+            if gate is not None:
+                gate.wait(5)
+            return load_words(filepath)
+
+        monkeypatch.setattr(main_window, "LARGE_FILE_BYTES", -1)
+        monkeypatch.setattr(main_window, "_load_words_from_file", gated_load_words)
+        return gates
+
+    def test_background_load_reaches_engine(self, window, warnings, gates, tmp_path, qtbot):
+        path = tmp_path / "a.txt"
+        path.write_text("one two three")
+        window._load_file(str(path))
+        qtbot.waitUntil(lambda: window._current_file == str(path), timeout=2000)
+        assert window._engine.word_count == 3
+        assert window._load_worker is None
+        assert warnings == []
+
+    def test_superseded_load_is_ignored(self, window, manager, warnings, gates, tmp_path, qtbot):
+        first = tmp_path / "first.txt"
+        first.write_text("first file words")
+        second = tmp_path / "second.txt"
+        second.write_text("second file with more words")
+        first_gate = gates[str(first)] = threading.Event()
+        second_gate = gates[str(second)] = threading.Event()
+
+        window._load_file(str(first))
+        first_worker = window._load_worker
+        window._load_file(str(second))
+        second_worker = window._load_worker
+
+        # The first load finishes first but was replaced by the second
+        with qtbot.waitSignal(first_worker.signals.finished, timeout=2000):
+            first_gate.set()
+        assert window._engine.word_count == 0
+        assert window._current_file is None
+
+        with qtbot.waitSignal(second_worker.signals.finished, timeout=2000):
+            second_gate.set()
+        assert window._current_file == str(second)
+        assert [w.text for w in window._engine.state.words] == [
+            "second", "file", "with", "more", "words",
+        ]
+        assert manager.settings.recent_files == [str(second)]
+        assert warnings == []
+
+
+class TestProgressDisplay:
+    """Tests for the frame-coalesced progress display."""
+
+    def test_word_and_progress_signals_update_once(self, window, qtbot, monkeypatch):
+        window._engine.load_text(" ".join(["word"] * 100))
+        qtbot.waitUntil(lambda: window._shown_progress == (0, 100), timeout=2000)
+
+        shown = []
+        update_word_count = window.progress_widget.update_word_count
+        monkeypatch.setattr(
+            window.progress_widget, "update_word_count",
+            lambda current, total: (shown.append(current), update_word_count(current, total)),
+        )
+        # Both word_changed and progress_changed fire for this seek
+        window._last_progress_update = 0.0
+        with qtbot.waitSignals(
+            [window._engine.word_changed, window._engine.progress_changed], timeout=2000
+        ):
+            window._engine.seek(50)
+        qtbot.waitUntil(lambda: window._shown_progress == (50, 100), timeout=2000)
+        qtbot.wait(50)
+
+        assert shown == [50]
+        assert not window._progress_timer.isActive()
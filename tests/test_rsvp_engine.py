@@ -64,6 +64,11 @@ class TestRSVPState:
         state = RSVPState(words=words, current_index=0)
         assert state.progress == 100.0
 
+    def test_progress_permille(self):
+        words = process_text("one two three four")
+        state = RSVPState(words=words, current_index=2)
+        assert state.progress_permille == 666
+
     def test_words_remaining_at_start(self):
         words = process_text("one two three")
         state = RSVPState(words=words, current_index=0)
@@ -101,6 +106,27 @@ class TestRSVPState:
         assert state.time_remaining_seconds == 0.0
 
 
+class TestRSVPStateColumns:
+    """Tests for the per-word columns derived from RSVPState.words."""
+
+    def test_default_columns_empty(self):
+        state = RSVPState()
+        assert list(state.pauses) == []
+        assert list(state.sentence_ends) == []
+
+    def test_columns_built_from_words(self):
+        words = process_text("Hi there. Bye, now!")
+        state = RSVPState(words=words)
+        assert list(state.pauses) == [1.0, 2.5, 1.5, 2.5]
+        assert list(state.sentence_ends) == [1, 3]
+
+    def test_set_words_rebuilds_columns(self):
+        state = RSVPState(words=process_text("One. Two."))
+        state.set_words(process_text("three"))
+        assert list(state.pauses) == [1.0]
+        assert list(state.sentence_ends) == []
+
+
 class TestRSVPEngine:
     """Tests for RSVPEngine class."""
 
@@ -117,6 +143,13 @@ class TestRSVPEngine:
         assert engine.word_count == 3
         assert engine.current_index == 0
 
+    def test_load_words(self, qapp):
+        engine = RSVPEngine()
+        engine.load_words(process_text("Hello world. Bye"))
+        assert engine.word_count == 3
+        assert list(engine.state.sentence_ends) == [1]
+        assert engine.state.current_word.text == "Hello"
+
     def test_load_empty_text(self, qapp):
         engine = RSVPEngine()
         engine.load_text("")
@@ -312,7 +345,7 @@ class TestRSVPEngineSignals:
         values = []
         engine.progress_changed.connect(lambda v: values.append(v))
         engine.load_text("Hello world")
-        assert 0.0 in values
+        assert 0 in values
 
     def test_play_emits_state_changed(self, qapp):
         engine = RSVPEngine()
@@ -342,7 +375,7 @@ class TestRSVPEngineSignals:
         engine.stop()
         assert len(words) >= 1
         assert words[-1].text == "one"  # reset to first word
-        assert 0.0 in progress
+        assert 0 in progress
 
     def test_seek_emits_word_and_progress(self, qapp):
         engine = RSVPEngine()
@@ -355,6 +388,44 @@ class TestRSVPEngineSignals:
         assert words[-1].text == "two"
         assert len(progress) >= 1
 
+    def test_load_text_emits_seconds_remaining(self, qapp):
+        engine = RSVPEngine()
+        engine.wpm = 300
+        seconds = []
+        engine.seconds_remaining_changed.connect(lambda s: seconds.append(s))
+        engine.load_text(" ".join(["word"] * 100))  # 100 * 0.2s
+        assert seconds[-1] == 20
+
+    def test_seconds_remaining_only_emitted_on_change(self, qapp):
+        engine = RSVPEngine()
+        engine.wpm = 300
+        engine.load_text(" ".join(["word"] * 100))
+        seconds = []
+        engine.seconds_remaining_changed.connect(lambda s: seconds.append(s))
+        engine.seek(1)  # 19.8s left
+        engine.seek(2)  # 19.6s left, same whole second
+        engine.seek(5)  # 19.0s left
+        assert seconds == [19]
+
+    def test_wpm_change_emits_seconds_remaining(self, qapp):
+        engine = RSVPEngine()
+        engine.wpm = 300
+        engine.load_text(" ".join(["word"] * 100))
+        seconds = []
+        engine.seconds_remaining_changed.connect(lambda s: seconds.append(s))
+        engine.wpm = 600
+        assert seconds == [10]
+
+    def test_progress_only_emitted_on_change(self, qapp):
+        engine = RSVPEngine()
+        engine.load_text(" ".join(["word"] * 5001))
+        progress = []
+        engine.progress_changed.connect(lambda p: progress.append(p))
+        engine.seek(1)  # 0.2 permille
+        engine.seek(4)  # 0.8 permille
+        engine.seek(5)  # 1 permille
+        assert progress == [1]
+
 
 class TestRSVPEngineAdvance:
     """Tests for _advance() — the core playback method."""
@@ -381,7 +452,7 @@ class TestRSVPEngineAdvance:
         engine.progress_changed.connect(lambda p: progress.append(p))
         engine._advance()
         assert len(progress) >= 1
-        assert progress[-1] == pytest.approx(50.0)  # 1/(3-1)*100
+        assert progress[-1] == 500  # 1/(3-1) in permille
 
     def test_advance_past_end_emits_finished(self, qapp):
         engine = RSVPEngine()
@@ -417,7 +488,7 @@ class TestRSVPEngineAdvance:
         engine.progress_changed.connect(lambda p: progress.append(p))
         engine._state.is_playing = True
         engine._advance()
-        assert progress[-1] == 100.0
+        assert progress[-1] == 1000
 
     def test_advance_full_playthrough(self, qapp):
         """Simulate a full playthrough by calling _advance repeatedly."""
@@ -468,6 +539,46 @@ class TestRSVPEngineTimerInterval:
         assert new_interval < initial_interval
         engine.pause()
 
+    def test_interval_measured_from_word_due_time(self, qapp):
+        engine = RSVPEngine()
+        engine.load_text("hello world")
+        engine.play()
+        # Pretend the current word was due 50ms ago; only the rest remains
+        engine._word_due -= 0.05
+        engine._update_timer_interval()
+        assert engine._timer.interval() == pytest.approx(150, abs=5)
+        engine.pause()
+
+    def test_advance_schedules_next_word_while_playing(self, qapp):
+        engine = RSVPEngine()
+        engine.load_text("one two three")
+        engine.play()
+        engine._advance()
+        assert engine.current_index == 1
+        assert engine._timer.isActive()
+        engine.pause()
+
+    def test_advance_resyncs_after_stall(self, qapp):
+        engine = RSVPEngine()
+        engine.load_text("one two three")
+        engine.play()
+        engine._deadline -= 5.0  # simulate a long event-loop stall
+        engine._advance()
+        # Schedule restarts from now instead of firing immediately
+        assert engine._timer.interval() == pytest.approx(200, abs=5)
+        engine.pause()
+
+    def test_unchanged_wpm_leaves_timer_alone(self, qapp):
+        engine = RSVPEngine()
+        engine.load_text("hello world")
+        engine.play()
+        engine._timer.setInterval(123)
+        engine.wpm = 300  # same as current
+        assert engine._timer.interval() == 123
+        engine.wpm = 5000  # clamps to 2000, a real change
+        assert engine._timer.interval() < 123
+        engine.pause()
+
 
 class TestRSVPStateTimeRemaining:
     """Tests for time_remaining_seconds with pause multipliers."""
@@ -587,6 +698,20 @@ class TestRSVPEngineSentenceNavigation:
         assert engine.current_index == 2
         assert engine.state.current_word.text == "Second"
 
+    def test_previous_sentence_skips_consecutive_endings(self, qapp):
+        engine = RSVPEngine()
+        engine.load_text("A b. C d! E? F g")
+        # "A"=0, "b."=1, "C"=2, "d!"=3, "E?"=4, "F"=5, "g"=6
+        engine.seek(5)
+        engine.previous_sentence()
+        assert engine.current_index == 2
+
+    def test_next_sentence_single_word_text(self, qapp):
+        engine = RSVPEngine()
+        engine.load_text("Hello.")
+        engine.next_sentence()
+        assert engine.current_index == 0
+
     def test_navigation_empty_text(self, qapp):
         engine = RSVPEngine()
         engine.next_sentence()  # should not crash
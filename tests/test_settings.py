@@ -46,6 +46,19 @@ class TestRSVPSettings:
         assert s.pause_at_paragraphs is True
         assert s.auto_save_position is True
 
+    def test_default_last_open_dir(self):
+        s = RSVPSettings()
+        assert s.last_open_dir == ""
+
+    def test_to_dict_matches_asdict(self):
+        from dataclasses import asdict
+        s = RSVPSettings(bookmarks={"a.txt": [1, 2]}, recent_files=["a.txt"])
+        assert s.to_dict() == asdict(s)
+
+    def test_to_dict_does_not_copy(self):
+        s = RSVPSettings(bookmarks={"a.txt": [1, 2]})
+        assert s.to_dict()["bookmarks"] is s.bookmarks
+
 
 class TestSettingsManager:
     """Tests for SettingsManager load/save and helpers."""
@@ -55,6 +68,8 @@ class TestSettingsManager:
         """Create a SettingsManager with a temp config path."""
         mgr = SettingsManager.__new__(SettingsManager)
         mgr._settings = RSVPSettings()
+        mgr._dirty = False
+        mgr._save_timer = None
         mgr._config_path = tmp_path / "settings.json"
         return mgr
 
@@ -98,6 +113,52 @@ class TestSettingsManager:
         assert "wpm" in data
         assert "font_family" in data
 
+    def test_save_leaves_no_temp_file(self, manager):
+        manager.save()
+        assert manager._config_path.exists()
+        assert not manager._config_path.with_suffix(".json.tmp").exists()
+
+    def test_save_replaces_existing_file(self, manager):
+        manager._config_path.write_text(json.dumps({"wpm": 100}))
+        manager.settings.wpm = 450
+        manager.save()
+        data = json.loads(manager._config_path.read_text())
+        assert data["wpm"] == 450
+
+    # --- Deferred saves ---
+
+    def test_mutation_save_is_deferred(self, manager, qapp):
+        manager.add_recent_file("/a.txt")
+        assert not manager._config_path.exists()
+        assert manager._save_timer.isActive()
+
+    def test_deferred_saves_coalesce(self, manager, qapp):
+        manager.add_recent_file("/a.txt")
+        manager.add_bookmark("/a.txt", 5)
+        manager.save_position("/a.txt", 7)
+        manager.flush()
+        data = json.loads(manager._config_path.read_text())
+        assert data["recent_files"] == ["/a.txt"]
+        assert data["bookmarks"] == {"/a.txt": [5]}
+        assert data["saved_positions"] == {"/a.txt": 7}
+        assert not manager._save_timer.isActive()
+
+    def test_deferred_save_fires_after_delay(self, manager, qtbot):
+        manager.add_recent_file("/a.txt")
+        qtbot.waitUntil(manager._config_path.exists, timeout=2000)
+        assert manager._dirty is False
+
+    def test_request_save_is_deferred(self, manager, qapp):
+        manager.settings.wpm = 420
+        manager.request_save()
+        assert not manager._config_path.exists()
+        manager.flush()
+        assert json.loads(manager._config_path.read_text())["wpm"] == 420
+
+    def test_flush_without_changes_does_not_write(self, manager):
+        manager.flush()
+        assert not manager._config_path.exists()
+
     # --- Recent files ---
 
     def test_add_recent_file(self, manager):
@@ -117,10 +178,36 @@ class TestSettingsManager:
         assert len(manager.settings.recent_files) == 3
         assert manager.settings.recent_files[0] == "/file4.txt"
 
+    def test_add_recent_file_moves_existing_to_front(self, manager):
+        manager.settings.max_recent_files = 3
+        for path in ("/a.txt", "/b.txt", "/c.txt"):
+            manager.add_recent_file(path)
+        manager.add_recent_file("/a.txt")
+        assert manager.settings.recent_files == ["/a.txt", "/c.txt", "/b.txt"]
+
+    def test_add_recent_file_zero_max(self, manager):
+        manager.settings.max_recent_files = 0
+        manager.add_recent_file("/a.txt")
+        assert manager.settings.recent_files == []
+
     def test_add_recent_file_persists(self, manager):
         manager.add_recent_file("/a.txt")
+        manager.flush()
         assert manager._config_path.exists()
 
+    # --- Last open directory ---
+
+    def test_set_last_open_dir(self, manager):
+        manager.set_last_open_dir("/books")
+        manager.flush()
+        data = json.loads(manager._config_path.read_text())
+        assert data["last_open_dir"] == "/books"
+
+    def test_set_last_open_dir_unchanged_does_not_save(self, manager):
+        manager.settings.last_open_dir = "/books"
+        manager.set_last_open_dir("/books")
+        assert manager._dirty is False
+
     # --- Bookmarks ---
 
     def test_add_bookmark(self, manager):
@@ -173,6 +260,8 @@ class TestSettingsErrorRecovery:
         mgr = SettingsManager.__new__(SettingsManager)
         mgr._settings = RSVPSettings()
         mgr._settings_were_reset = False
+        mgr._dirty = False
+        mgr._save_timer = None
         mgr._config_path = tmp_path / "settings.json"
         return mgr
 
@@ -219,6 +308,8 @@ class TestSettingsPositionTracking:
         mgr = SettingsManager.__new__(SettingsManager)
         mgr._settings = RSVPSettings()
         mgr._settings_were_reset = False
+        mgr._dirty = False
+        mgr._save_timer = None
         mgr._config_path = tmp_path / "settings.json"
         return mgr
 
@@ -244,6 +335,7 @@ class TestSettingsPositionTracking:
 
     def test_save_position_persists(self, manager):
         manager.save_position("/file.txt", 42)
+        manager.flush()
         assert manager._config_path.exists()
         data = json.loads(manager._config_path.read_text())
         assert data["saved_positions"] == {"/file.txt": 42}
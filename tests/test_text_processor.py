@@ -1,5 +1,7 @@
 """Tests for text_processor module."""
 import os
+import subprocess
+import sys
 import pytest
 from rsvp.core.text_processor import (
     Word,
@@ -8,6 +10,7 @@ from rsvp.core.text_processor import (
     process_text,
     extract_text_from_html,
     load_text_from_file,
+    load_text_prefix,
     strip_markdown,
 )
 
@@ -133,6 +136,30 @@ class TestWord:
         assert word.orp_char == "I"
         assert word.after_orp == ""
 
+    def test_slices_split_once(self):
+        word = Word(text="reading", orp_index=2, pause_after=1.0)
+        assert word.after_orp is word.after_orp
+        assert word.before_orp is word.before_orp
+
+    def test_slices_not_part_of_equality(self):
+        word = Word(text="hello", orp_index=2, pause_after=1.0)
+        assert word == Word(text="hello", orp_index=2, pause_after=1.0)
+
+    def test_word_is_read_only(self):
+        from dataclasses import FrozenInstanceError
+        word = Word(text="hello", orp_index=2, pause_after=1.0)
+        with pytest.raises(FrozenInstanceError):
+            word.orp_index = 3
+
+    def test_replace_resplits(self):
+        from dataclasses import replace
+        word = replace(Word(text="hello", orp_index=2, pause_after=1.0), orp_index=1)
+        assert (word.before_orp, word.orp_char, word.after_orp) == ("h", "e", "llo")
+
+    def test_word_has_no_instance_dict(self):
+        word = Word(text="hello", orp_index=2, pause_after=1.0)
+        assert not hasattr(word, "__dict__")
+
 
 class TestProcessText:
     """Tests for process_text function."""
@@ -184,6 +211,18 @@ class TestProcessText:
         assert len(words) == 9
         assert words[-1].pause_after == 2.5  # ends with period
 
+    def test_repeated_tokens_share_word(self):
+        words = process_text("the cat and the dog")
+        assert words[0] is words[3]
+        assert words[0].text == "the"
+
+    def test_paragraph_flag_not_shared_between_repeats(self):
+        words = process_text("Go now.\n\nnow. again now.")
+        assert words[1].paragraph_break_after is True
+        assert words[2].text == "now."
+        assert words[2].paragraph_break_after is False
+        assert words[4].paragraph_break_after is False
+
 
 class TestExtractTextFromHTML:
     """Tests for HTML text extraction."""
@@ -226,6 +265,46 @@ class TestExtractTextFromHTML:
         assert "Nested" in text
         assert "content" in text
 
+    def test_removes_comments(self):
+        html = "<p>Visible<!-- hidden note --> text</p>"
+        text = extract_text_from_html(html)
+        assert "hidden" not in text
+        assert text == "Visible text"
+
+    def test_keeps_text_after_removed_tag(self):
+        html = "<div><footer>Footer</footer> trailing words</div>"
+        text = extract_text_from_html(html)
+        assert "Footer" not in text
+        assert "trailing words" in text
+
+    def test_block_tags_separate_paragraphs(self):
+        html = "<h1>Title</h1><p>First</p><p>Second</p>"
+        text = extract_text_from_html(html)
+        assert text == "Title\n\nFirst\n\nSecond"
+
+    @pytest.mark.parametrize("tag", [
+        "script", "style", "nav", "header", "footer", "aside", "template",
+    ])
+    def test_skip_tags_drop_nested_content(self, tag):
+        html = f"<p>Before</p><{tag}><div><p>Hidden text</p></div></{tag}><p>After</p>"
+        text = extract_text_from_html(html)
+        assert text == "Before\n\nAfter"
+
+    def test_unclosed_skip_tag_keeps_following_text(self):
+        html = "<div>Intro<aside>Side<p>note</aside> after</div>"
+        text = extract_text_from_html(html)
+        assert text == "Intro after"
+
+    def test_unclosed_block_tags_break_paragraphs(self):
+        html = "<p>One<p>Two<br>Three<ul><li>a<li>b</ul><p>text<hr>more"
+        text = extract_text_from_html(html)
+        assert text == "One\n\nTwo\n\nThree\n\na\n\nb\n\ntext\n\nmore"
+
+    def test_inline_tags_do_not_break(self):
+        html = "<p>a <b>bold</b> and <i>it</i>alic<td>cell</td></p>"
+        text = extract_text_from_html(html)
+        assert text == "a bold and italiccell"
+
 
 class TestLoadTextFromFile:
     """Tests for load_text_from_file function."""
@@ -259,6 +338,42 @@ class TestLoadTextFromFile:
         with pytest.raises(FileNotFoundError):
             load_text_from_file("/nonexistent/path/file.txt")
 
+    def test_load_normalizes_line_endings(self, tmp_path):
+        f = tmp_path / "crlf.txt"
+        f.write_bytes(b"Line one\r\n\r\nLine two\rLine three")
+        text = load_text_from_file(str(f))
+        assert text == "Line one\n\nLine two\nLine three"
+
+    def test_load_invalid_utf8_replaces_bytes(self, tmp_path):
+        f = tmp_path / "latin1.txt"
+        f.write_bytes("caf\xe9 time".encode("latin-1"))
+        text = load_text_from_file(str(f))
+        assert text == "caf\ufffd time"
+
+
+class TestLoadTextPrefix:
+    """Tests for load_text_prefix function."""
+
+    def test_prefix_of_long_file(self, tmp_path):
+        f = tmp_path / "long.txt"
+        f.write_text("word " * 10000, encoding="utf-8")
+        assert load_text_prefix(str(f), 12) == "word word wo"
+
+    def test_short_file_returned_whole(self, tmp_path):
+        f = tmp_path / "short.txt"
+        f.write_bytes(b"Line one\r\nLine two")
+        assert load_text_prefix(str(f), 100) == "Line one\nLine two"
+
+    def test_multibyte_chars_not_split(self, tmp_path):
+        f = tmp_path / "utf8.txt"
+        f.write_text("\u00e9" * 100, encoding="utf-8")
+        assert load_text_prefix(str(f), 10) == "\u00e9" * 10
+
+    def test_parsed_formats_return_none(self, tmp_path):
+        f = tmp_path / "notes.md"
+        f.write_text("# Title", encoding="utf-8")
+        assert load_text_prefix(str(f), 100) is None
+
 
 class TestParagraphBreakDetection:
     """Tests for paragraph break detection in process_text."""
@@ -477,3 +592,45 @@ class TestLoadPdf:
     def test_pdf_pages_separated(self, pdf_path):
         result = load_text_from_file(pdf_path)
         assert "\n\n" in result
+
+
+class TestFetchTextFromUrl:
+    """Tests for fetch_text_from_url and its shared HTTP session."""
+
+    def test_session_reused_between_fetches(self, monkeypatch):
+        import requests
+        from rsvp.core import text_processor
+
+        class FakeResponse:
+            text = "<p>Page text</p>"
+
+            def raise_for_status(self):
+                pass
+
+        used = []
+
+        def fake_get(session, url, timeout=None):
+            used.append(session)
+            return FakeResponse()
+
+        # Start without a session so the first fetch creates and stores one
+        monkeypatch.setattr(text_processor, "_http_session", None)
+        monkeypatch.setattr(requests.Session, "get", fake_get)
+
+        assert text_processor.fetch_text_from_url("http://a.test/") == "Page text"
+        assert text_processor.fetch_text_from_url("http://b.test/") == "Page text"
+        assert len(used) == 2
+        assert used[0] is used[1]
+        assert used[0] is text_processor._http_session
+
+
+class TestImports:
+    """Tests for the module's import footprint."""
+
+    def test_no_qt_in_text_processor(self):
+        """Text processing can be imported without pulling in PyQt6."""
+        # Run in a fresh interpreter; pytest-qt has already imported Qt here
+        code = "import sys, rsvp.core.text_processor; sys.exit('PyQt6' in sys.modules)"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], cwd=root)
+        assert result.returncode == 0
@@ -0,0 +1,146 @@
+"""Tests for background workers and the URL fetch they run."""
+import threading
+
+import pytest
+import requests
+
+from rsvp.core import text_processor
+from rsvp.core.text_processor import fetch_text_from_url
+from rsvp.ui.workers import TaskWorker
+
+
+class FakeResponse:
+    """Stand-in for requests.Response holding a canned page."""
+
+    def __init__(self, text: str = "", status_code: int = 200):
+        self.text = text
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+
+class FakeSession(requests.Session):
+    """Stand-in for the shared HTTP session serving pages by URL.
+
+    A URL with a gate only responds once its threading.Event is set, so tests
+    can control the order in which fetches finish. It subclasses Session so it
+    also fits the session global's type in the mypyc-compiled module.
+    """
+
+    def __init__(self, pages: dict):
+        super().__init__()
+        self.pages = pages
+        self.gates: dict[str, threading.Event] = {}
+
+    def get(self, url, timeout=None):
+        gate = self.gates.get(url)
+        if gate is not None:
+            gate.wait(5)
+        page = self.pages[url]
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Serve fetch_text_from_url from a FakeSession instead of the network.
+
+    The shared session global is replaced rather than _get_http_session, which
+    the compiled module calls directly.
+    """
+    session = FakeSession({})
+    monkeypatch.setattr(text_processor, "_http_session", session)
+    return session
+
+
+class TestTaskWorker:
+    """Tests for TaskWorker running a URL fetch on the thread pool."""
+
+    def test_fetch_emits_finished_with_text(self, fake_session, qtbot):
+        fake_session.pages["http://a.test/"] = FakeResponse("<p>Hello world</p>")
+        worker = TaskWorker(fetch_text_from_url, "http://a.test/")
+        with qtbot.waitSignal(worker.signals.finished, timeout=2000) as blocker:
+            worker.start()
+        assert blocker.args == ["Hello world"]
+
+    def test_http_error_emits_failed(self, fake_session, qtbot):
+        fake_session.pages["http://a.test/"] = FakeResponse(status_code=404)
+        worker = TaskWorker(fetch_text_from_url, "http://a.test/")
+        finished = []
+        worker.signals.finished.connect(finished.append)
+        with qtbot.waitSignal(worker.signals.failed, timeout=2000) as blocker:
+            worker.start()
+        assert "404" in blocker.args[0]
+        assert finished == []
+
+    def test_exception_emits_failed(self, fake_session, qtbot):
+        fake_session.pages["http://a.test/"] = requests.ConnectionError("no route")
+        worker = TaskWorker(fetch_text_from_url, "http://a.test/")
+        with qtbot.waitSignal(worker.signals.failed, timeout=2000) as blocker:
+            worker.start()
+        assert blocker.args == ["no route"]
+
+
+class TestUrlFetchInDialog:
+    """Tests for TextInputDialog handling fetches that finish in any order."""
+
+    @pytest.fixture
+    def warnings(self, monkeypatch):
+        """Record the dialog's warnings instead of blocking on a modal box."""
+        from rsvp.ui import text_input_dialog
+        shown = []
+        monkeypatch.setattr(
+            text_input_dialog.QMessageBox, "warning",
+            lambda parent, title, text: shown.append(text),
+        )
+        return shown
+
+    @pytest.fixture
+    def dialog(self, qtbot, warnings):
+        from rsvp.ui.text_input_dialog import TextInputDialog
+        dlg = TextInputDialog()
+        qtbot.addWidget(dlg)
+        return dlg
+
+    def _fetch(self, dialog, url):
+        """Start fetching url and return its worker."""
+        dialog.url_edit.setText(url)
+        dialog._fetch_url()
+        return dialog._fetch_worker
+
+    def test_fetch_shows_text(self, dialog, warnings, fake_session, qtbot):
+        fake_session.pages["http://a.test/"] = FakeResponse("<p>First page</p>")
+        self._fetch(dialog, "http://a.test/")
+        qtbot.waitUntil(lambda: dialog._fetch_worker is None, timeout=2000)
+        assert dialog.url_preview.toPlainText() == "First page"
+        assert dialog._url_text == "First page"
+        assert dialog._source_path == "http://a.test/"
+        assert dialog.fetch_btn.isEnabled()
+        assert warnings == []
+
+    def test_superseded_fetch_is_ignored(self, dialog, warnings, fake_session, qtbot):
+        fake_session.pages["http://old.test/"] = FakeResponse("<p>Old page</p>")
+        fake_session.pages["http://new.test/"] = FakeResponse("<p>New page</p>")
+        old_gate = fake_session.gates["http://old.test/"] = threading.Event()
+        new_gate = fake_session.gates["http://new.test/"] = threading.Event()
+
+        old_worker = self._fetch(dialog, "http://old.test/")
+        new_worker = self._fetch(dialog, "http://new.test/")
+
+        # The old fetch finishes first but was replaced by the new one
+        with qtbot.waitSignal(old_worker.signals.finished, timeout=2000):
+            old_gate.set()
+        assert dialog.url_preview.toPlainText() == "Fetching..."
+        assert dialog._url_text == ""
+        assert dialog._fetch_worker is new_worker
+        assert not dialog.fetch_btn.isEnabled()
+
+        with qtbot.waitSignal(new_worker.signals.finished, timeout=2000):
+            new_gate.set()
+        assert dialog.url_preview.toPlainText() == "New page"
+        assert dialog._source_path == "http://new.test/"
+        assert dialog._fetch_worker is None
+        assert warnings == []